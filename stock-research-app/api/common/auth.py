@@ -1,33 +1,71 @@
 import base64
 import json
-from typing import Optional, Dict
+import threading
+import time
+from collections import OrderedDict
+from typing import Mapping, Optional, Dict
 from .google_auth import verify_google_id_token
 
 # Static Web Apps sends X-MS-CLIENT-PRINCIPAL with user info when using built-in auth.
 # For local dev, we fall back to a fixed dev user.
 
-def get_user_context(headers: Dict[str, str]) -> Dict[str, Optional[str]]:
+# Verified-token cache: JWT signature verification costs tens of ms and the
+# same bearer token arrives on every request from a session. A short TTL keeps
+# revocation/expiry windows tight while serving repeat calls from memory.
+_TOKEN_CACHE: OrderedDict = OrderedDict()
+_TOKEN_CACHE_MAX = 1024
+_TOKEN_CACHE_TTL = 60.0  # seconds
+_token_lock = threading.Lock()
+
+
+def _header(headers: Mapping[str, str], name: str) -> Optional[str]:
+    """Case-insensitive header lookup that works for both the framework's
+    case-insensitive header mapping and plain dicts."""
+    v = headers.get(name)
+    if v is not None:
+        return v
+    lname = name.lower()
+    for k, val in headers.items():
+        if k.lower() == lname:
+            return val
+    return None
+
+
+def _verify_token_cached(token: str) -> Optional[Dict[str, str]]:
+    now = time.monotonic()
+    with _token_lock:
+        entry = _TOKEN_CACHE.get(token)
+        if entry is not None and now - entry[0] < _TOKEN_CACHE_TTL:
+            _TOKEN_CACHE.move_to_end(token)
+            return dict(entry[1])
+
+    user = verify_google_id_token(token)
+    # Only cache successes: verify_google_id_token returns None for transient
+    # failures (e.g. fetching Google's certs) as well as bad tokens, and
+    # pinning a None would lock a valid session out for the whole TTL.
+    if user is not None:
+        with _token_lock:
+            _TOKEN_CACHE[token] = (now, user)
+            if len(_TOKEN_CACHE) > _TOKEN_CACHE_MAX:
+                _TOKEN_CACHE.popitem(last=False)
+        return dict(user)
+    return None
+
+
+def get_user_context(headers: Mapping[str, str]) -> Dict[str, Optional[str]]:
     """
     Returns a dict with keys: userId, name, provider.
+    Accepts the request's headers mapping directly (no dict() copy needed).
     """
     # First, try Authorization: Bearer (Google ID token for local/dev or custom frontends)
-    authz = None
-    for k, v in headers.items():
-        if k.lower() == "authorization":
-            authz = v
-            break
+    authz = _header(headers, "authorization")
     if authz and isinstance(authz, str) and authz.lower().startswith("bearer "):
         token = authz.split(" ", 1)[1].strip()
-        user = verify_google_id_token(token)
+        user = _verify_token_cached(token)
         if user:
             return user
 
-    principal_b64 = None
-    # Headers can be case-insensitive; normalize access
-    for k, v in headers.items():
-        if k.lower() == "x-ms-client-principal":
-            principal_b64 = v
-            break
+    principal_b64 = _header(headers, "x-ms-client-principal")
 
     if principal_b64:
         try:
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
 from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+from urllib.parse import urlencode, urlsplit, urlunsplit, parse_qsl
 import re
+import threading
+import time
 
 import httpx
 from bs4 import BeautifulSoup
@@ -12,6 +16,15 @@ except Exception:
 
 from .config import Settings
 
+# One process-wide HTTP client so searches and page fetches reuse pooled
+# keep-alive connections instead of paying a TCP+TLS handshake per call.
+_client = httpx.Client(
+    follow_redirects=True,
+    timeout=20.0,
+    headers={"User-Agent": "Mozilla/5.0"},
+    limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+)
+
 def web_search(query: str, top_k: int = 6) -> List[Dict[str, str]]:
     """
     Uses Bing Web Search v7 if configured. Otherwise returns [].
@@ -29,10 +42,9 @@ def web_search(query: str, top_k: int = 6) -> List[Dict[str, str]]:
     headers = {"Ocp-Apim-Subscription-Key": key}
     params = {"q": q, "count": max(1, int(top_k or 1)), "textDecorations": False, "safeSearch": "Moderate"}
     try:
-        with httpx.Client(timeout=15.0) as client:
-            r = client.get(url, headers=headers, params=params)
-            r.raise_for_status()
-            data = r.json()
+        r = _client.get(url, headers=headers, params=params, timeout=15.0)
+        r.raise_for_status()
+        data = r.json()
     except Exception:
         return []
 
@@ -51,21 +63,68 @@ def _strip_text(t: str) -> str:
     t = re.sub(r"\s+", " ", (t or "").strip())
     return t
 
+# Extraction cache keyed by canonical URL: the same article often shows up
+# in results for several symbols, and re-downloading + re-parsing it costs
+# hundreds of ms versus a dict lookup. Entries expire so stale excerpts
+# don't outlive a news cycle.
+_URL_CACHE: OrderedDict = OrderedDict()
+_URL_CACHE_MAX = 512
+_URL_CACHE_TTL = 900.0  # seconds
+_url_lock = threading.Lock()
+
+def _canonical_url(u: str) -> str:
+    """Normalizes a URL for cache keying: drops fragments and tracking
+    params (utm_* etc.) and sorts the remaining query keys."""
+    try:
+        scheme, netloc, path, query, _frag = urlsplit(u)
+        params = [
+            (k, v)
+            for k, v in parse_qsl(query, keep_blank_values=True)
+            if not k.lower().startswith(("utm_", "fbclid", "gclid"))
+        ]
+        params.sort()
+        return urlunsplit((scheme.lower(), netloc.lower(), path, urlencode(params), ""))
+    except Exception:
+        return u
+
 def fetch_and_extract(url: str) -> Optional[Dict[str, str]]:
     """
     Fetches a URL and extracts a readable title + excerpt using readability-lxml.
     Returns {"title": str, "url": str, "excerpt": str} or None on failure.
+    Results are cached per canonical URL for a short TTL.
     """
     u = (url or "").strip()
     if not u:
         return None
+
+    cache_key = _canonical_url(u)
+    now = time.monotonic()
+    with _url_lock:
+        entry = _URL_CACHE.get(cache_key)
+        if entry is not None and now - entry[0] < _URL_CACHE_TTL:
+            _URL_CACHE.move_to_end(cache_key)
+            return dict(entry[1])
+
+    result = _fetch_and_extract_uncached(u)
+    if result is None:
+        # Download failed (timeout, 4xx/5xx, network blip): return the empty
+        # sentinel but don't cache it, so the next request retries instead of
+        # serving a blank excerpt for the whole TTL.
+        return {"title": u, "url": u, "excerpt": ""}
+    with _url_lock:
+        _URL_CACHE[cache_key] = (now, result)
+        if len(_URL_CACHE) > _URL_CACHE_MAX:
+            _URL_CACHE.popitem(last=False)
+    return dict(result)
+
+def _fetch_and_extract_uncached(u: str) -> Optional[Dict[str, str]]:
+    """Downloads and extracts; returns None when the download itself fails."""
     try:
-        with httpx.Client(follow_redirects=True, timeout=20.0, headers={"User-Agent": "Mozilla/5.0"}) as client:
-            r = client.get(u)
-            r.raise_for_status()
-            html = r.text
+        r = _client.get(u)
+        r.raise_for_status()
+        html = r.text
     except Exception:
-        return {"title": u, "url": u, "excerpt": ""}
+        return None
 
     if Document is not None:
         try:
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
@@ -17,6 +20,14 @@ from .config import get_storage_connection_string, Settings
 _user_delegation_key: Optional[UserDelegationKey] = None
 _user_delegation_key_expiry: Optional[datetime] = None
 
+# Signed-URL memo keyed by (container, path, expiry_hours, 5-min bucket):
+# repeat reads of the same report regenerate an identical HMAC signature, so
+# serve it from memory and let the bucket roll the URL every five minutes.
+_SAS_CACHE: OrderedDict = OrderedDict()
+_SAS_CACHE_MAX = 4096
+_SAS_BUCKET_SECONDS = 300
+_sas_lock = threading.Lock()
+
 
 def _get_credential():
     """Get credential for Managed Identity if configured."""
@@ -29,14 +40,41 @@ def _get_credential():
     return None
 
 
+# Process-wide service client (lazy init): constructing a BlobServiceClient
+# per call meant a fresh connection pool — and a fresh TLS handshake — for
+# every upload/delete/SAS request.
+_svc_client: Optional[BlobServiceClient] = None
+_svc_lock = threading.Lock()
+_ensured_containers: set = set()
+
+
 def _svc() -> BlobServiceClient:
+    global _svc_client
+    if _svc_client is None:
+        with _svc_lock:
+            if _svc_client is None:
+                _svc_client = _build_svc()
+    return _svc_client
+
+
+# Transfer tuning shared by both client constructors: 4 MiB ranges let
+# download_blob(max_concurrency=N) split MB-sized blobs across parallel GETs,
+# and a larger pool keeps those connections from queueing on urllib3.
+_TRANSFER_OPTS = {
+    "max_single_get_size": 4 * 1024 * 1024,
+    "max_chunk_get_size": 4 * 1024 * 1024,
+    "connection_pool_maxsize": 32,
+}
+
+
+def _build_svc() -> BlobServiceClient:
     # Check if we should use Managed Identity
     if Settings.AZURE_STORAGE_ACCOUNT_NAME:
         credential = _get_credential()
         if credential:
             account_url = f"https://{Settings.AZURE_STORAGE_ACCOUNT_NAME}.blob.core.windows.net"
-            return BlobServiceClient(account_url, credential=credential)
-    
+            return BlobServiceClient(account_url, credential=credential, **_TRANSFER_OPTS)
+
     # Fall back to connection string
     conn = get_storage_connection_string()
     if conn.strip().lower() == "usedevelopmentstorage=true":
@@ -49,14 +87,17 @@ def _svc() -> BlobServiceClient:
             "QueueEndpoint=http://127.0.0.1:10001/devstoreaccount1;"
             "TableEndpoint=http://127.0.0.1:10002/devstoreaccount1;"
         )
-    return BlobServiceClient.from_connection_string(conn)
+    return BlobServiceClient.from_connection_string(conn, **_TRANSFER_OPTS)
 
 def _ensure_container(svc: BlobServiceClient, container: str) -> None:
+    if container in _ensured_containers:
+        return
     try:
         svc.create_container(container)
     except Exception:
         # Likely exists
         pass
+    _ensured_containers.add(container)
 
 def _content_settings(content_type: Optional[str]) -> Optional[ContentSettings]:
     if not content_type:
@@ -96,10 +137,28 @@ def _try_parse_account_from_conn_str(conn_str: str) -> tuple[Optional[str], Opti
 
 def make_read_sas_url(container: str, blob_path: str, expiry_hours: int = 48) -> Optional[str]:
     """
-    Builds a read-only SAS URL for the given blob. 
+    Builds a read-only SAS URL for the given blob.
     Uses User Delegation SAS with Managed Identity when available, otherwise falls back to account key.
     Returns None if credentials are unavailable.
+    URLs are memoized per 5-minute window so hot reports reuse one signature.
     """
+    bucket = int(time.time() // _SAS_BUCKET_SECONDS)
+    key = (container, blob_path, int(expiry_hours), bucket)
+    with _sas_lock:
+        cached = _SAS_CACHE.get(key)
+        if cached is not None:
+            _SAS_CACHE.move_to_end(key)
+            return cached
+
+    url = _make_read_sas_url_uncached(container, blob_path, expiry_hours)
+    if url is not None:
+        with _sas_lock:
+            _SAS_CACHE[key] = url
+            if len(_SAS_CACHE) > _SAS_CACHE_MAX:
+                _SAS_CACHE.popitem(last=False)
+    return url
+
+def _make_read_sas_url_uncached(container: str, blob_path: str, expiry_hours: int) -> Optional[str]:
     global _user_delegation_key, _user_delegation_key_expiry
     
     expiry_time = datetime.now(timezone.utc) + timedelta(hours=max(1, int(expiry_hours)))
@@ -165,6 +224,15 @@ def make_read_sas_url(container: str, blob_path: str, expiry_hours: int = 48) ->
     except Exception:
         return None
 
+def blob_exists(container: str, blob_path: str) -> bool:
+    """Returns True if the blob exists; False on missing blob or any error."""
+    try:
+        svc = _svc()
+        bc = svc.get_blob_client(container=container, blob=blob_path)
+        return bool(bc.exists())
+    except Exception:
+        return False
+
 def delete_blob(container: str, blob_path: str) -> bool:
     """
     Deletes a blob if it exists. Returns True if deletion succeeded (or blob didn't exist),
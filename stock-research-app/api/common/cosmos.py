@@ -2,6 +2,9 @@ from __future__ import annotations
 
 import json
 import os
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional
 from uuid import uuid4
@@ -76,6 +79,39 @@ def _get_cosmos_container(container_name: str):
 # Local file storage (for development)
 # ─────────────────────────────────────────────────────────────────────────────
 
+# Short-TTL cache over Cosmos point reads: hot paths (a user re-opening a
+# report, polling a run) repeat the same (id, userId) read_item within
+# seconds, and each one costs an RU plus a network round-trip. Five seconds
+# is short enough that mutations stay visible promptly; writers invalidate
+# their key explicitly as well.
+_DOC_CACHE: OrderedDict = OrderedDict()
+_DOC_CACHE_MAX = 2048
+_DOC_CACHE_TTL = 5.0  # seconds
+_doc_lock = threading.Lock()
+
+
+def _doc_cache_get(kind: str, doc_id: str, user_id: str) -> Optional[Dict[str, Any]]:
+    key = (kind, doc_id, user_id)
+    with _doc_lock:
+        entry = _DOC_CACHE.get(key)
+        if entry is not None and time.monotonic() - entry[0] < _DOC_CACHE_TTL:
+            _DOC_CACHE.move_to_end(key)
+            return dict(entry[1])
+    return None
+
+
+def _doc_cache_put(kind: str, doc_id: str, user_id: str, doc: Dict[str, Any]) -> None:
+    with _doc_lock:
+        _DOC_CACHE[(kind, doc_id, user_id)] = (time.monotonic(), dict(doc))
+        if len(_DOC_CACHE) > _DOC_CACHE_MAX:
+            _DOC_CACHE.popitem(last=False)
+
+
+def _doc_cache_pop(kind: str, doc_id: str, user_id: str) -> None:
+    with _doc_lock:
+        _DOC_CACHE.pop((kind, doc_id, user_id), None)
+
+
 _DATA_DIR = Path(__file__).resolve().parents[2] / ".data"
 _DATA_FILE = _DATA_DIR / "db.json"
 
@@ -84,27 +120,60 @@ def _now_iso() -> str:
     return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
 
 
+# Parsed-store cache, invalidated by file mtime so out-of-process edits are
+# still picked up; the schedule index maps (userId, id) -> list position so
+# updates are O(1) instead of a scan per PUT.
+_store_cache: Optional[Dict[str, Any]] = None
+_store_mtime: Optional[float] = None
+_sched_idx: Dict[tuple, int] = {}
+
+
 def _ensure_store() -> Dict[str, Any]:
     """Local file store for development."""
+    global _store_cache, _store_mtime
     if not _DATA_DIR.exists():
         _DATA_DIR.mkdir(parents=True, exist_ok=True)
     if not _DATA_FILE.exists():
         initial = {"schedules": [], "runs": [], "reports": [], "tracked_stocks": []}
         _DATA_FILE.write_text(json.dumps(initial, indent=2), encoding="utf-8")
+        _store_cache, _store_mtime = initial, _DATA_FILE.stat().st_mtime
+        _sched_idx.clear()
         return initial
+    mtime = _DATA_FILE.stat().st_mtime
+    if _store_cache is not None and mtime == _store_mtime:
+        return _store_cache
     try:
         data = json.loads(_DATA_FILE.read_text(encoding="utf-8"))
         if "tracked_stocks" not in data:
             data["tracked_stocks"] = []
-        return data
     except Exception:
-        initial = {"schedules": [], "runs": [], "reports": [], "tracked_stocks": []}
-        _DATA_FILE.write_text(json.dumps(initial, indent=2), encoding="utf-8")
-        return initial
+        data = {"schedules": [], "runs": [], "reports": [], "tracked_stocks": []}
+        _DATA_FILE.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        mtime = _DATA_FILE.stat().st_mtime
+    _store_cache, _store_mtime = data, mtime
+    _sched_idx.clear()
+    return data
 
 
 def _save_store(db: Dict[str, Any]) -> None:
+    global _store_cache, _store_mtime
     _DATA_FILE.write_text(json.dumps(db, indent=2), encoding="utf-8")
+    _store_cache, _store_mtime = db, _DATA_FILE.stat().st_mtime
+
+
+def _schedule_pos(db: Dict[str, Any], schedule_id: str, user_id: str) -> Optional[int]:
+    """O(1) lookup of a schedule's position, rebuilding the index lazily."""
+    key = (user_id, schedule_id)
+    scheds = db.get("schedules", [])
+    i = _sched_idx.get(key)
+    if i is not None and i < len(scheds):
+        s = scheds[i]
+        if s.get("id") == schedule_id and s.get("userId") == user_id:
+            return i
+    _sched_idx.clear()
+    for idx, s in enumerate(scheds):
+        _sched_idx[(s.get("userId"), s.get("id"))] = idx
+    return _sched_idx.get(key)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -129,9 +198,13 @@ def create_schedule(sched: Schedule) -> Dict[str, Any]:
 
 def get_schedule(schedule_id: str, user_id: str) -> Optional[Dict[str, Any]]:
     if USE_COSMOS:
+        cached = _doc_cache_get("schedule", schedule_id, user_id)
+        if cached is not None:
+            return cached
         container = _get_cosmos_container("schedules")
         try:
             item = container.read_item(item=schedule_id, partition_key=user_id)
+            _doc_cache_put("schedule", schedule_id, user_id, item)
             return dict(item)
         except Exception:
             return None
@@ -186,6 +259,7 @@ def update_schedule_next_run(schedule_id: str, user_id: str, next_iso: str) -> b
             item = container.read_item(item=schedule_id, partition_key=user_id)
             item["nextRunAt"] = next_iso
             container.replace_item(item=schedule_id, body=item)
+            _doc_cache_pop("schedule", schedule_id, user_id)
             return True
         except Exception:
             return False
@@ -236,6 +310,7 @@ def delete_schedule(schedule_id: str, user_id: str) -> bool:
         container = _get_cosmos_container("schedules")
         try:
             container.delete_item(item=schedule_id, partition_key=user_id)
+            _doc_cache_pop("schedule", schedule_id, user_id)
             return True
         except Exception:
             return False
@@ -264,20 +339,18 @@ def update_schedule(schedule_id: str, user_id: str, updates: Dict[str, Any]) ->
             item = container.read_item(item=schedule_id, partition_key=user_id)
             item.update(updates)
             container.replace_item(item=schedule_id, body=item)
+            _doc_cache_pop("schedule", schedule_id, user_id)
             return True
         except Exception:
             return False
     else:
         db = _ensure_store()
-        changed = False
-        for s in db.get("schedules", []):
-            if s.get("id") == schedule_id and s.get("userId") == user_id:
-                s.update(updates)
-                changed = True
-                break
-        if changed:
-            _save_store(db)
-        return changed
+        i = _schedule_pos(db, schedule_id, user_id)
+        if i is None:
+            return False
+        db["schedules"][i].update(updates)
+        _save_store(db)
+        return True
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -357,9 +430,13 @@ def save_report(report: Report) -> Dict[str, Any]:
 
 def get_report(report_id: str, user_id: str) -> Optional[Dict[str, Any]]:
     if USE_COSMOS:
+        cached = _doc_cache_get("report", report_id, user_id)
+        if cached is not None:
+            return cached
         container = _get_cosmos_container("reports")
         try:
             item = container.read_item(item=report_id, partition_key=user_id)
+            _doc_cache_put("report", report_id, user_id, item)
             return dict(item)
         except Exception:
             return None
@@ -397,12 +474,15 @@ def list_reports_for_user(user_id: str, schedule_id: Optional[str] = None, limit
                 {"name": "@userId", "value": user_id},
                 {"name": "@limit", "value": limit}
             ]
-        items = list(container.query_items(
+        # Return a lazy generator so callers can stream page-by-page instead
+        # of holding the whole result set twice; max_item_count=-1 lets the
+        # service pick its preferred page size.
+        return (dict(i) for i in container.query_items(
             query=query,
             parameters=params,
-            enable_cross_partition_query=True
+            enable_cross_partition_query=True,
+            max_item_count=-1,
         ))
-        return [dict(i) for i in items]
     else:
         db = _ensure_store()
         items: List[Dict[str, Any]] = []
@@ -422,6 +502,7 @@ def delete_report(report_id: str, user_id: str) -> Optional[Dict[str, Any]]:
         try:
             item = container.read_item(item=report_id, partition_key=user_id)
             container.delete_item(item=report_id, partition_key=user_id)
+            _doc_cache_pop("report", report_id, user_id)
             return dict(item)
         except Exception:
             return None
@@ -442,6 +523,52 @@ def delete_report(report_id: str, user_id: str) -> Optional[Dict[str, Any]]:
         return deleted
 
 
+def delete_reports_bulk(report_ids: List[str], user_id: str) -> int:
+    """
+    Best-effort bulk delete of report docs that share the userId partition.
+    On Cosmos, groups ids into transactional batches of 100 so N deletes cost
+    ceil(N/100) round-trips; a failed batch falls back to per-item deletes so
+    one bad id doesn't sink its neighbours. Returns the number deleted.
+    """
+    ids = [r for r in report_ids if r]
+    if not ids:
+        return 0
+    deleted = 0
+    if USE_COSMOS:
+        container = _get_cosmos_container("reports")
+        for start in range(0, len(ids), 100):
+            chunk = ids[start:start + 100]
+            try:
+                container.execute_item_batch(
+                    batch_operations=[("delete", (rid,)) for rid in chunk],
+                    partition_key=user_id,
+                )
+                deleted += len(chunk)
+            except Exception:
+                for rid in chunk:
+                    try:
+                        container.delete_item(item=rid, partition_key=user_id)
+                        deleted += 1
+                    except Exception:
+                        pass
+        for rid in ids:
+            _doc_cache_pop("report", rid, user_id)
+        return deleted
+    else:
+        db = _ensure_store()
+        target = set(ids)
+        kept: List[Dict[str, Any]] = []
+        for r in db.get("reports", []):
+            if r.get("id") in target and r.get("userId") == user_id:
+                deleted += 1
+            else:
+                kept.append(r)
+        if deleted:
+            db["reports"] = kept
+            _save_store(db)
+        return deleted
+
+
 def list_all_reports() -> List[Dict[str, Any]]:
     """Returns all reports across users (for cleanup/maintenance tasks)."""
     if USE_COSMOS:
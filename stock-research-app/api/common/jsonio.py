@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+# orjson serializes 2-5x faster than stdlib json and emits bytes directly,
+# skipping the str->utf-8 re-encode when handing a body to HttpResponse.
+# Fall back to stdlib so local environments without the wheel still work.
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
+
+
+def dumps(obj: Any) -> bytes:
+    """Serializes obj to UTF-8 JSON bytes, via orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def loads(data: Any) -> Any:
+    """Parses JSON from bytes or str, via orjson when available.
+
+    Raises ValueError on malformed input with either backend
+    (orjson.JSONDecodeError subclasses ValueError).
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -8,50 +8,337 @@ try:
     from openai import AzureOpenAI
 except Exception:  # pragma: no cover
     AzureOpenAI = None
-
-from azure.identity import DefaultAzureCredential
-# Try multiple SDK import variants to support newer packages
-AIProjectsClient = None
 try:
-    # Prefer the Azure AI Projects client; if unavailable, disable Agents path.
-    from azure.ai.projects import AIProjectClient as _AIProjectsClient
-    AIProjectsClient = _AIProjectsClient
+    from openai import AsyncAzureOpenAI
+except Exception:  # pragma: no cover
+    AsyncAzureOpenAI = None
+try:
+    from openai import APIConnectionError, APITimeoutError, RateLimitError, InternalServerError
+    _RETRYABLE_ERRORS: tuple = (APIConnectionError, APITimeoutError, RateLimitError, InternalServerError)
 except Exception:  # pragma: no cover
-    AIProjectsClient = None
-# Try to import agent thread/run models for create_thread_and_process_run
+    _RETRYABLE_ERRORS = ()
 try:
-    from azure.ai.agents.models import AgentThreadCreationOptions, ThreadMessage, ThreadMessageOptions, ListSortOrder, MessageTextContent, DeepResearchTool
+    from tenacity import AsyncRetrying, Retrying, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
 except Exception:  # pragma: no cover
-    AgentThreadCreationOptions = None
-    ThreadMessageOptions = None
-    ListSortOrder = None
-    MessageTextContent = None
-    DeepResearchTool = None
+    AsyncRetrying = None
+    Retrying = None
+
+# The azure.identity / azure.ai.projects / azure.ai.agents stack costs
+# hundreds of ms and tens of MB at import time, and workers that only ever
+# hit the chat-completions or local fallback paths never need it. The
+# symbols below stay None until _ensure_azure_sdk() resolves them on first
+# agent use.
+DefaultAzureCredential = None
+AIProjectsClient = None
+AgentThreadCreationOptions = None
+ThreadMessage = None
+ThreadMessageOptions = None
+ListSortOrder = None
+MessageTextContent = None
+DeepResearchTool = None
+_azure_sdk_loaded = False
+
+def _ensure_azure_sdk() -> bool:
+    """Import the azure credential/agents SDKs on first use. Returns True
+    when the Projects client is available. Safe to call repeatedly."""
+    global _azure_sdk_loaded, DefaultAzureCredential, AIProjectsClient
+    global AgentThreadCreationOptions, ThreadMessage, ThreadMessageOptions
+    global ListSortOrder, MessageTextContent, DeepResearchTool
+    if _azure_sdk_loaded:
+        return AIProjectsClient is not None
+    try:
+        from azure.identity import DefaultAzureCredential as _DAC
+        DefaultAzureCredential = _DAC
+    except Exception:  # pragma: no cover
+        DefaultAzureCredential = None
+    # Try multiple SDK import variants to support newer packages
+    try:
+        # Prefer the Azure AI Projects client; if unavailable, disable Agents path.
+        from azure.ai.projects import AIProjectClient as _AIProjectsClient
+        AIProjectsClient = _AIProjectsClient
+    except Exception:  # pragma: no cover
+        AIProjectsClient = None
+    # Try to import agent thread/run models for create_thread_and_process_run
+    try:
+        from azure.ai.agents.models import AgentThreadCreationOptions as _ATCO, ThreadMessage as _TM, ThreadMessageOptions as _TMO, ListSortOrder as _LSO, MessageTextContent as _MTC, DeepResearchTool as _DRT
+        AgentThreadCreationOptions, ThreadMessage, ThreadMessageOptions = _ATCO, _TM, _TMO
+        ListSortOrder, MessageTextContent, DeepResearchTool = _LSO, _MTC, _DRT
+    except Exception:  # pragma: no cover
+        pass
+    logger.info("openai_agent: availability - AIProjectsClient=%s, AzureOpenAI=%s", bool(AIProjectsClient), bool(AzureOpenAI))
+    # Log installed azure-ai-projects version for diagnostics
+    try:
+        import azure.ai.projects as _ai_projects_mod
+        logger.info("azure-ai-projects version: %s", getattr(_ai_projects_mod, "__version__", "unknown"))
+    except Exception as _e:
+        logger.info("azure-ai-projects version: unavailable (%s)", repr(_e))
+    # Log which client symbol we resolved to (AIProjectClient vs AgentsClient)
+    with contextlib.suppress(Exception):
+        logger.info("ai_projects: resolved client symbol: %s", getattr(AIProjectsClient, "__name__", None))
+    _azure_sdk_loaded = True
+    return AIProjectsClient is not None
 
+import asyncio
+import contextlib
+import functools
+import hashlib
+import itertools
+import json
+import operator
+import threading
 import time
 import os
+import re
 import html
+from collections import OrderedDict
 from .config import Settings
 
+# C-level getters for the Settings fallbacks used by _resolve_projects_config.
+_SETTINGS_EP = operator.attrgetter("AZURE_AI_PROJECTS_ENDPOINT")
+_SETTINGS_PR = operator.attrgetter("AZURE_AI_PROJECTS_PROJECT")
+_SETTINGS_AG = operator.attrgetter("AZURE_AI_PROJECTS_AGENT_ID")
+
+def _settings_val(getter) -> str:
+    try:
+        return getter(Settings) or ""
+    except AttributeError:
+        return ""
+
 import logging
 logger = logging.getLogger("stock.openai_agent")
-logger.info("openai_agent: availability - AIProjectsClient=%s, AzureOpenAI=%s", bool(AIProjectsClient), bool(AzureOpenAI))
-# Log installed azure-ai-projects version for diagnostics
-try:
-    import azure.ai.projects as _ai_projects_mod
-    logger.info("azure-ai-projects version: %s", getattr(_ai_projects_mod, "__version__", "unknown"))
-except Exception as _e:
-    logger.info("azure-ai-projects version: unavailable (%s)", repr(_e))
-
-# Log which client symbol we resolved to (AIProjectClient vs AgentsClient)
-try:
-    _client_name = getattr(AIProjectsClient, "__name__", None)
-    logger.info("ai_projects: resolved client symbol: %s", _client_name)
-except Exception:
-    pass
 
 _md = MarkdownIt("gfm-like", {"linkify": False, "html": True})
 
+# Optional C-backed CommonMark renderer; 10-50x faster than the pure-Python
+# MarkdownIt on report-sized documents. Set FAST_MD=0 to force MarkdownIt.
+_cmark_render = None
+_cmark_options = None
+if os.getenv("FAST_MD", "1") != "0":
+    try:
+        from cmarkgfm import github_flavored_markdown_to_html as _cmark_render
+        from cmarkgfm.cmark import Options as _cmark_options
+    except Exception:  # pragma: no cover
+        _cmark_render = None
+        _cmark_options = None
+
+# Rendered-HTML cache keyed by content digest: retries and re-renders of the
+# same markdown skip the CPU-bound parse. Digest keys bound memory to the
+# HTML values themselves; MarkdownIt is not thread-safe, so rendering is
+# serialized behind a lock.
+_RENDER_CACHE: OrderedDict = OrderedDict()
+_RENDER_CACHE_MAX = 128
+_render_lock = threading.Lock()
+
+def _render_md(md_text: str) -> str:
+    """Render markdown to HTML via cmarkgfm when available, else MarkdownIt."""
+    key = hashlib.blake2b(md_text.encode("utf-8"), digest_size=16).digest()
+    with _render_lock:
+        cached = _RENDER_CACHE.get(key)
+        if cached is not None:
+            _RENDER_CACHE.move_to_end(key)
+            return cached
+        if _cmark_render is not None:
+            try:
+                # UNSAFE keeps raw HTML passthrough (superscript citation links),
+                # matching the MarkdownIt "html": True configuration.
+                rendered = _cmark_render(md_text, options=_cmark_options.CMARK_OPT_UNSAFE)
+            except Exception:
+                rendered = _md.render(md_text)
+        else:
+            rendered = _md.render(md_text)
+        _RENDER_CACHE[key] = rendered
+        if len(_RENDER_CACHE) > _RENDER_CACHE_MAX:
+            _RENDER_CACHE.popitem(last=False)
+        return rendered
+
+class _LazyReport(dict):
+    """Report dict whose "html" entry is rendered from "markdown" on first
+    access rather than eagerly. Callers that only consume the markdown
+    (JSON API clients, the frontend's client-side renderer) never pay for
+    the markdown→HTML conversion. Note that "html" is absent from plain
+    dict views (json.dumps, .items()) until accessed; wire boundaries
+    should call materialize()."""
+
+    def __missing__(self, key):
+        if key == "html":
+            html = _render_md(super().get("markdown") or "")
+            self["html"] = html
+            return html
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        if key == "html" and "html" not in self:
+            return self["html"]
+        return super().get(key, default)
+
+    def materialize(self) -> Dict[str, Any]:
+        """Plain dict with "html" rendered, for JSON serialization."""
+        self["html"]
+        return dict(self)
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Shared credential / client singletons. Building DefaultAzureCredential (MSAL
+# probe chain) or a new HTTP client per request costs hundreds of ms; reuse one
+# of each per worker and keep connections warm.
+# ─────────────────────────────────────────────────────────────────────────────
+
+# Settings values are environment-derived and constant for the life of the
+# process; bind them once at import so hot paths skip repeated class-attribute
+# lookups.
+_AOAI_ENDPOINT = Settings.AZURE_OPENAI_ENDPOINT
+_AOAI_API_VERSION = Settings.AZURE_OPENAI_API_VERSION
+_AOAI_API_KEY = Settings.AZURE_OPENAI_API_KEY
+_AOAI_DEPLOYMENT = Settings.AZURE_OPENAI_DEPLOYMENT
+_AOAI_ASSISTANT_ID = Settings.AZURE_OAI_ASSISTANT_ID
+
+_COGNITIVE_SCOPE = "https://cognitiveservices.azure.com/.default"
+_gating_logged = False  # one-shot flag for the per-process gating diagnostics
+_client_lock = threading.Lock()
+_cred: Optional[DefaultAzureCredential] = None
+_aad_token: Optional[Tuple[str, float]] = None  # (token, expires_on)
+_aoai_client = None
+_aoai_async_client = None
+_projects_clients: Dict[Tuple[str, str], Any] = {}  # (endpoint, project) -> AIProjectsClient
+_projects_objs: Dict[Tuple[str, str], Any] = {}  # (endpoint, project) -> resolved project
+
+def _get_credential() -> DefaultAzureCredential:
+    global _cred
+    if _cred is None:
+        _ensure_azure_sdk()
+        with _client_lock:
+            if _cred is None:
+                _cred = DefaultAzureCredential(exclude_interactive_browser_credential=False)
+    return _cred
+
+def _get_aad_token() -> str:
+    """Cached AAD bearer token for Cognitive Services; refreshed 5 min early."""
+    global _aad_token
+    now = time.time()
+    tok = _aad_token
+    if tok is None or tok[1] - now < 300:
+        with _client_lock:
+            tok = _aad_token
+            if tok is None or tok[1] - now < 300:
+                t = _get_credential().get_token(_COGNITIVE_SCOPE)
+                tok = (t.token, float(t.expires_on))
+                _aad_token = tok
+    return tok[0]
+
+def _get_aoai_client():
+    """Singleton AzureOpenAI client (API key if set, else AAD token provider)."""
+    global _aoai_client
+    if _aoai_client is None:
+        with _client_lock:
+            if _aoai_client is None:
+                if _AOAI_API_KEY:
+                    _aoai_client = AzureOpenAI(
+                        azure_endpoint=_AOAI_ENDPOINT,
+                        api_version=_AOAI_API_VERSION,
+                        api_key=_AOAI_API_KEY,
+                    )
+                else:
+                    _aoai_client = AzureOpenAI(
+                        azure_endpoint=_AOAI_ENDPOINT,
+                        api_version=_AOAI_API_VERSION,
+                        azure_ad_token_provider=_get_aad_token,
+                    )
+    return _aoai_client
+
+def _get_aoai_async_client():
+    """Singleton AsyncAzureOpenAI client mirroring _get_aoai_client."""
+    global _aoai_async_client
+    if _aoai_async_client is None:
+        with _client_lock:
+            if _aoai_async_client is None:
+                if _AOAI_API_KEY:
+                    _aoai_async_client = AsyncAzureOpenAI(
+                        azure_endpoint=_AOAI_ENDPOINT,
+                        api_version=_AOAI_API_VERSION,
+                        api_key=_AOAI_API_KEY,
+                    )
+                else:
+                    _aoai_async_client = AsyncAzureOpenAI(
+                        azure_endpoint=_AOAI_ENDPOINT,
+                        api_version=_AOAI_API_VERSION,
+                        azure_ad_token_provider=_get_aad_token,
+                    )
+    return _aoai_async_client
+
+def _get_projects_client(endpoint: str, project: str):
+    """Cached AIProjectsClient per (endpoint, project); rebuilding the
+    policy pipeline and credential chain on every synthesize call is
+    pure overhead since the transport pool is already shared."""
+    key = (endpoint or "", project or "")
+    client = _projects_clients.get(key)
+    if client is None:
+        with _client_lock:
+            client = _projects_clients.get(key)
+            if client is None:
+                client = AIProjectsClient(endpoint=endpoint, credential=_get_credential())
+                _projects_clients[key] = client
+    return client
+
+def _get_project_obj(client, endpoint: str, project: str):
+    """Memoized client.get_project() result so the lookup RPC runs once
+    per (endpoint, project) per worker. Returns None when unsupported."""
+    key = (endpoint or "", project or "")
+    if key in _projects_objs:
+        return _projects_objs[key]
+    project_obj = None
+    try:
+        if hasattr(client, "get_project"):
+            project_obj = client.get_project(project)
+        elif hasattr(client, "projects") and hasattr(client.projects, "get_project"):
+            project_obj = client.projects.get_project(project)
+    except Exception as pe:
+        logger.debug("ai_projects: get_project failed: %s", repr(pe))
+        project_obj = None
+    _projects_objs[key] = project_obj
+    return project_obj
+
+def _wait_retry_after(retry_state):
+    """Honor the service's Retry-After header when present, else back off exponentially."""
+    exc = retry_state.outcome.exception() if retry_state.outcome else None
+    resp = getattr(exc, "response", None)
+    if resp is not None:
+        try:
+            ra = float(resp.headers.get("Retry-After") or 0)
+            if ra > 0:
+                return min(ra, 30.0)
+        except Exception:
+            pass
+    return wait_exponential_jitter(initial=0.5, max=8)(retry_state)
+
+def _chat_completions_create(client, **kwargs):
+    """
+    client.chat.completions.create with up to 3 attempts on transient errors
+    (429, timeouts, connection drops, 5xx). Non-retryable 4xx raise straight
+    through; without tenacity installed this is a plain passthrough.
+    """
+    if Retrying is None or not _RETRYABLE_ERRORS:
+        return client.chat.completions.create(**kwargs)
+    for attempt in Retrying(
+        retry=retry_if_exception_type(_RETRYABLE_ERRORS),
+        wait=_wait_retry_after,
+        stop=stop_after_attempt(3),
+        reraise=True,
+    ):
+        with attempt:
+            return client.chat.completions.create(**kwargs)
+
+# First '# ' heading in a markdown blob; single-pass scan instead of splitlines().
+_TITLE_RE = re.compile(r"(?m)^# (.+)$")
+
+# Bare domain (e.g. example.com/path) for URL normalization.
+_DOMAIN_RE = re.compile(r"^[A-Za-z0-9.-]+\.[A-Za-z]{2,}(/.*)?$")
+
+# Inline citation markers emitted by grounded agents, e.g. '【3:0†source】'.
+_MARKER_RE = re.compile(r"【[^】]+】")
+
+def _extract_title_line(text: str) -> Optional[str]:
+    m = _TITLE_RE.search(text)
+    return m.group(1).strip() if m else None
+
 def _normalize_url(u: str) -> str:
     """
     Ensure URLs are absolute and clickable. Adds https:// for bare domains or www.*, and resolves //scheme-relative.
@@ -69,8 +356,7 @@ def _normalize_url(u: str) -> str:
             return s
         if s.startswith("www."):
             return "https://" + s
-        import re as _re
-        if _re.match(r"^[A-Za-z0-9.-]+\.[A-Za-z]{2,}(/.*)?$", s):
+        if _DOMAIN_RE.match(s):
             return "https://" + s
         return s
     except Exception:
@@ -83,36 +369,82 @@ def _esc_attr(s: str) -> str:
     except Exception:
         return s or ""
 
-def _extract_url_citations_from_message(msg : ThreadMessage) -> List[Dict[str, str]]:
+def _extract_annotations(msg: ThreadMessage) -> Tuple[List[Dict[str, str]], Dict[str, Dict[str, str]]]:
     """
-    Extract URL citations from a ThreadMessage, matching the raw schema:
-      content[*].text.annotations[*].url_citation.{url,title}
-    Falls back to .details if SDK maps to that name.
+    Single pass over a ThreadMessage's url_citation_annotations producing both
+    the citations list ({title,url} items, raw schema
+    content[*].text.annotations[*].url_citation.{url,title}, falling back to
+    .details) and the inline-marker (e.g. '【3:0†source】') -> {url,title} map.
     """
-    results: List[Dict[str, str]] = []
+    citations: List[Dict[str, str]] = []
+    marker_map: Dict[str, Dict[str, str]] = {}
+    anns = getattr(msg, "url_citation_annotations", None)
+    if not anns:
+        return citations, marker_map
     try:
-        anns = msg.url_citation_annotations
-        if not anns:
-            return results
         for a in anns:
-            url = ""
-            title = "Source"
             try:
-                details = a.url_citation
-                if details:
-                    _u = getattr(details, "url", "") or ""
-                    url = _normalize_url(_u)
-                    title = getattr(details, "title", None) or "Source"
+                details = getattr(a, "url_citation", None) or getattr(a, "details", None)
+                raw_url = getattr(details, "url", "") if details else ""
+                url = _normalize_url(raw_url)
+                if not url:
+                    continue
+                title = (getattr(details, "title", None) if details else None) or "Source"
+                citations.append({"title": str(title), "url": str(url)})
+                marker = getattr(a, "text", None) or ""
+                if marker:
+                    marker_map[str(marker)] = {"url": str(url), "title": str(title)}
             except Exception:
-                url = ""
-                title = "Source"
-            if url:
-                results.append({"title": str(title), "url": str(url)})
+                pass
     except Exception as _e:
-        logger.debug("extract url citations failed: %s", repr(_e))
-    return results
+        logger.debug("extract annotations failed: %s", repr(_e))
+    return citations, marker_map
+
+def _collect_citations(sources_per_symbol: List[Dict[str, Any]], citations: Optional[List[Dict[str, str]]] = None, seen_urls: Optional[set] = None) -> List[Dict[str, str]]:
+    """
+    Append {title,url} entries for every fetched source, deduplicated by
+    normalized URL while preserving insertion order. Pass existing
+    citations/seen_urls to merge with annotation-derived entries.
+    """
+    if citations is None:
+        citations = []
+    if seen_urls is None:
+        seen_urls = set()
+    for entry in sources_per_symbol or []:
+        for s in entry.get("sources") or []:
+            u = _normalize_url(s.get("url") or "")
+            if u and u not in seen_urls:
+                citations.append({"title": s.get("title") or "Source", "url": u})
+                seen_urls.add(u)
+    return citations
+
+def _message_text_parts(msg) -> List[str]:
+    """Non-empty text values from a message's content parts, preferring the
+    typed text_messages view when the SDK provides one."""
+    if hasattr(msg, "text_messages") and msg.text_messages:
+        parts_iter = msg.text_messages
+    else:
+        parts_iter = getattr(msg, "content", []) or []
+    return [v for v in (_extract_part_value(p) for p in parts_iter) if v]
+
+def _extract_part_value(part) -> str:
+    """
+    Pull the text value out of a message content part, regardless of whether the
+    SDK handed us a typed object, a raw dict, or a bare string.
+    """
+    val = getattr(getattr(part, "text", None), "value", None)
+    if val is not None:
+        return val or ""
+    t = type(part)
+    if t is dict:
+        return (part.get("text", {}) or {}).get("value", "") or ""
+    if t is str:
+        return part
+    return ""
 
 def _debug_log_url_annotations(msg) -> None:
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
     try:
         anns = getattr(msg, "url_citation_annotations", None) or []
         for i, a in enumerate(anns):
@@ -129,29 +461,6 @@ def _debug_log_url_annotations(msg) -> None:
     except Exception:
         pass
 
-def _build_marker_map(msg) -> Dict[str, Dict[str, str]]:
-    """
-    Build a mapping from inline marker text (e.g., '【3:0†source】') to {url,title}
-    from a ThreadMessage's url_citation_annotations.
-    """
-    mapping: Dict[str, Dict[str, str]] = {}
-    try:
-        anns = getattr(msg, "url_citation_annotations", None) or []
-        for a in anns:
-            try:
-                marker = getattr(a, "text", None) or ""
-                details = getattr(a, "url_citation", None) or getattr(a, "details", None)
-                raw_url = getattr(details, "url", "") if details else ""
-                url = _normalize_url(raw_url)
-                title = getattr(details, "title", None) or "Source"
-                if marker and url:
-                    mapping[str(marker)] = {"url": str(url), "title": str(title)}
-            except Exception:
-                pass
-    except Exception:
-        pass
-    return mapping
-
 def _inject_superscripts_from_annotations(text: str, marker_map: Dict[str, Dict[str, str]]) -> Tuple[str, List[Dict[str, str]], Dict[str, int]]:
     """
     Replace inline marker substrings (e.g., '【3:0†source】') with superscripted
@@ -160,8 +469,11 @@ def _inject_superscripts_from_annotations(text: str, marker_map: Dict[str, Dict[
     """
     if not isinstance(text, str) or not text or not marker_map:
         return text, [], {}
-    import re
-    pattern = re.compile(r"【[^】]+】")
+    # Fast reject: str.__contains__ is far cheaper than running the regex
+    # over a marker-free body, which is the common case without grounding.
+    if "【" not in text:
+        return text, [], {}
+    pattern = _MARKER_RE
 
     url_to_index: Dict[str, int] = {}
     next_idx = 1
@@ -207,39 +519,52 @@ def _inject_superscripts_from_annotations(text: str, marker_map: Dict[str, Dict[
             pass
         citations.append({"title": title, "url": url})
 
-    try:
+    with contextlib.suppress(Exception):
         logger.debug("superscripts injected: replacements=%d, urls=%d", replaced, len(url_to_index))
-    except Exception:
-        pass
     return new_text, citations, url_to_index
 
+@functools.lru_cache(maxsize=4)
 def _resolve_projects_config(mode: str):
     """
     Resolve Azure AI Projects endpoint/project (and agent_id for AgentMode) based on mode.
     Falls back to Settings.* when specific env vars are not set.
     Modes: "AgentMode", "DeepResearch"
+    Cached per mode: env vars are immutable for the lifetime of the worker.
     """
     if mode == "AgentMode":
-        ep = os.getenv("AZURE_AI_PROJECTS_AGENTMODE_ENDPOINT") or getattr(Settings, "AZURE_AI_PROJECTS_ENDPOINT", "")
-        pr = os.getenv("AZURE_AI_PROJECTS_AGENTMODE_PROJECT") or getattr(Settings, "AZURE_AI_PROJECTS_PROJECT", "")
-        ag = os.getenv("AZURE_AI_PROJECTS_AGENTMODE_AGENT_ID") or getattr(Settings, "AZURE_AI_PROJECTS_AGENT_ID", "")
+        ep = os.getenv("AZURE_AI_PROJECTS_AGENTMODE_ENDPOINT") or _settings_val(_SETTINGS_EP)
+        pr = os.getenv("AZURE_AI_PROJECTS_AGENTMODE_PROJECT") or _settings_val(_SETTINGS_PR)
+        ag = os.getenv("AZURE_AI_PROJECTS_AGENTMODE_AGENT_ID") or _settings_val(_SETTINGS_AG)
         return ep, pr, ag
     if mode == "DeepResearch":
-        ep = os.getenv("AZURE_AI_PROJECTS_DEEPRESEARCH_ENDPOINT") or getattr(Settings, "AZURE_AI_PROJECTS_ENDPOINT", "")
-        pr = os.getenv("AZURE_AI_PROJECTS_DEEPRESEARCH_PROJECT") or getattr(Settings, "AZURE_AI_PROJECTS_PROJECT", "")
+        ep = os.getenv("AZURE_AI_PROJECTS_DEEPRESEARCH_ENDPOINT") or _settings_val(_SETTINGS_EP)
+        pr = os.getenv("AZURE_AI_PROJECTS_DEEPRESEARCH_PROJECT") or _settings_val(_SETTINGS_PR)
         return ep, pr, None
-    return getattr(Settings, "AZURE_AI_PROJECTS_ENDPOINT", ""), getattr(Settings, "AZURE_AI_PROJECTS_PROJECT", ""), getattr(Settings, "AZURE_AI_PROJECTS_AGENT_ID", "")
+    return _settings_val(_SETTINGS_EP), _settings_val(_SETTINGS_PR), _settings_val(_SETTINGS_AG)
+
+@functools.lru_cache(maxsize=1)
+def _dr_instructions() -> str:
+    """Agent instructions from deepresearch.md, read once per worker;
+    the file ships with the app and does not change at runtime."""
+    default_instructions = "You are a helpful Agent that performs deep web research and produces a well-cited markdown report."
+    instructions_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "deepresearch.md")
+    try:
+        with open(instructions_path, "r", encoding="utf-8") as f:
+            return f.read().strip() or default_instructions
+    except Exception:
+        return default_instructions
 
 def _synthesize_with_deep_research(symbols: List[str], sources_per_symbol: List[Dict[str, Any]], user_prompt: Optional[str] = None) -> Dict[str, Any]:
     """
     Use Azure AI Projects Agents with the Deep Research tool to produce the report.
     Follows the Python sample: create DeepResearchTool, create an agent with that tool, run, collect output.
     """
+    _ensure_azure_sdk()
     if not (AIProjectsClient and DeepResearchTool):
         raise RuntimeError("Deep Research not available (client or tool missing)")
 
     projects_endpoint, projects_project, _ = _resolve_projects_config("DeepResearch")
-    logger.info("ai_projects (DeepResearch): endpoint=%r project=%r", projects_endpoint, projects_project)
+    logger.debug("ai_projects (DeepResearch): endpoint=%r project=%r", projects_endpoint, projects_project)
     if not projects_endpoint:
         raise RuntimeError("PROJECT endpoint not configured")
 
@@ -251,46 +576,29 @@ def _synthesize_with_deep_research(symbols: List[str], sources_per_symbol: List[
     bing_name = os.getenv("BING_RESOURCE_NAME", "")
     try:
         if bing_name:
-            cred = DefaultAzureCredential(exclude_interactive_browser_credential=False)
-            client_tmp = AIProjectsClient(endpoint=projects_endpoint, credential=cred)
-            logger.info("ai_projects: attempting to resolve Bing connection by name=%r", bing_name)
-            project_obj = None
-            try:
-                if hasattr(client_tmp, "get_project"):
-                    project_obj = client_tmp.get_project(projects_project)
-                elif hasattr(client_tmp, "projects") and hasattr(client_tmp.projects, "get_project"):
-                    project_obj = client_tmp.projects.get_project(projects_project)
-            except Exception as pe:
-                logger.debug("ai_projects: get_project failed: %s", repr(pe))
-                project_obj = None
+            client_tmp = _get_projects_client(projects_endpoint, projects_project)
+            logger.debug("ai_projects: attempting to resolve Bing connection by name=%r", bing_name)
+            project_obj = _get_project_obj(client_tmp, projects_endpoint, projects_project)
             connections_svc = getattr(project_obj, "connections", None) if project_obj is not None else getattr(client_tmp, "connections", None)
-            logger.info("ai_projects: connections_svc=%s (from project_obj=%s)", type(connections_svc).__name__ if connections_svc else None, project_obj is not None)
+            logger.debug("ai_projects: connections_svc=%s (from project_obj=%s)", type(connections_svc).__name__ if connections_svc else None, project_obj is not None)
             if connections_svc is not None and hasattr(connections_svc, "get"):
                 conn = connections_svc.get(name=bing_name)
                 conn_id = getattr(conn, "id", "") or ""
-                logger.info("ai_projects: resolved Bing connection id=%r", conn_id)
+                logger.debug("ai_projects: resolved Bing connection id=%r", conn_id)
     except Exception as e:
         logger.warning("ai_projects: failed to resolve Bing connection: %s", repr(e))
     
     if not conn_id:
         raise RuntimeError(f"Bing connection id not configured - could not resolve BING_RESOURCE_NAME={bing_name!r} to a connection id")
 
-    cred = DefaultAzureCredential(exclude_interactive_browser_credential=False)
-    client = AIProjectsClient(endpoint=projects_endpoint, credential=cred)
-    agents_svc = client.agents 
+    client = _get_projects_client(projects_endpoint, projects_project)
+    agents_svc = client.agents
     # Create Deep Research tool and agent
     dr_tool = DeepResearchTool(
         bing_grounding_connection_id=conn_id,
         deep_research_model=deep_model,
     )
-    default_instructions = "You are a helpful Agent that performs deep web research and produces a well-cited markdown report."
-    base_dir = os.path.dirname(__file__)
-    instructions_path = os.path.join(os.path.dirname(base_dir), "deepresearch.md")
-    try:
-        with open(instructions_path, "r", encoding="utf-8") as f:
-            instructions = f.read().strip() or default_instructions
-    except Exception:
-        instructions = default_instructions
+    instructions = _dr_instructions()
     agent = agents_svc.create_agent(
         model=model_name,
         name="deep-research-agent",
@@ -300,100 +608,92 @@ def _synthesize_with_deep_research(symbols: List[str], sources_per_symbol: List[
 
     # Build prompt and run
     prompt = user_prompt.strip() if user_prompt else _build_prompt(symbols, sources_per_symbol, None)
-    thread = agents_svc.threads.create()
-    agents_svc.messages.create(thread_id=getattr(thread, "id", None), role="user", content=prompt)
-    run = agents_svc.runs.create(thread_id=getattr(thread, "id", None), agent_id=getattr(agent, "id", None))
-
-    # Poll until completion
-    for _ in range(1200):
+    if hasattr(agents_svc, "create_thread_and_process_run") and AgentThreadCreationOptions and ThreadMessageOptions:
+        # One-shot thread+message+run that the SDK drives to a terminal
+        # state, collapsing the create/create/create/poll sequence into a
+        # single call (mirrors the AgentMode path).
+        run = agents_svc.create_thread_and_process_run(
+            agent_id=getattr(agent, "id", None),
+            thread=AgentThreadCreationOptions(messages=[ThreadMessageOptions(role="user", content=prompt)]),
+        )
         status = getattr(run, "status", None)
-        if status in ("completed", "succeeded"):
-            break
         if status in ("failed", "cancelled", "expired", "timed_out", "canceled"):
             raise RuntimeError(f"DeepResearch run status: {status}")
-        time.sleep(1)
-        run = agents_svc.runs.get(thread_id=getattr(thread, "id", None), run_id=getattr(run, "id", None))
+        thread_id = getattr(run, "thread_id", None)
+    else:
+        thread = agents_svc.threads.create()
+        thread_id = getattr(thread, "id", None)
+        agents_svc.messages.create(thread_id=thread_id, role="user", content=prompt)
+        run = agents_svc.runs.create(thread_id=thread_id, agent_id=getattr(agent, "id", None))
+
+        # Poll until completion with exponential backoff. Deep Research runs
+        # routinely take minutes, so fixed 1s polling would emit hundreds of
+        # RPCs; backing off to a 30s cap keeps the same ~20 min budget with
+        # an order of magnitude fewer round trips.
+        delay = 1.0
+        deadline = time.monotonic() + 1200.0
+        while True:
+            status = getattr(run, "status", None)
+            if status in ("completed", "succeeded"):
+                break
+            if status in ("failed", "cancelled", "expired", "timed_out", "canceled"):
+                raise RuntimeError(f"DeepResearch run status: {status}")
+            if time.monotonic() >= deadline:
+                raise RuntimeError("DeepResearch run timed out")
+            time.sleep(delay)
+            delay = min(delay * 1.6, 30.0)
+            run = agents_svc.runs.get(thread_id=thread_id, run_id=getattr(run, "id", None))
 
     # Collect latest assistant message
     text = ""
     url_citations: List[Dict[str, str]] = []
+    marker_map: Dict[str, Dict[str, str]] = {}
     try:
         last_msg = None
         if hasattr(agents_svc, "messages") and hasattr(agents_svc.messages, "get_last_message_by_role"):
-            last_msg = agents_svc.messages.get_last_message_by_role(thread_id=getattr(thread, "id", None), role="assistant")
+            last_msg = agents_svc.messages.get_last_message_by_role(thread_id=thread_id, role="assistant")
         if last_msg is None:
-            messages = agents_svc.messages.list(thread_id=getattr(thread, "id", None), order=(ListSortOrder.ASCENDING if ListSortOrder else None))
-            for msg in messages:
-                if getattr(msg, "role", "") == "assistant":
-                    last_msg = msg
+            # Newest-first so the scan stops at the first assistant message
+            # instead of walking the whole thread history.
+            messages = agents_svc.messages.list(thread_id=thread_id, order=(ListSortOrder.DESCENDING if ListSortOrder else None))
+            last_msg = next((m for m in messages if getattr(m, "role", "") == "assistant"), None)
         collected: List[str] = []
         if last_msg is not None:
-            if hasattr(last_msg, "text_messages") and last_msg.text_messages:
-                for t in last_msg.text_messages:
-                    val = getattr(getattr(t, "text", None), "value", "") or ""
-                    if val:
-                        collected.append(val)
-            else:
-                for part in getattr(last_msg, "content", []) or []:
-                    if (MessageTextContent is not None) and isinstance(part, MessageTextContent):
-                        val = getattr(getattr(part, "text", None), "value", "") or ""
-                    elif isinstance(part, dict):
-                        val = (part.get("text", {}) or {}).get("value", "") or ""
-                    elif isinstance(part, str):
-                        val = part
-                    else:
-                        val = ""
-                    if val:
-                        collected.append(val)
+            collected = _message_text_parts(last_msg)
         if collected:
             # Log each assistant text segment
-            try:
+            if logger.isEnabledFor(logging.DEBUG):
                 for i, seg in enumerate(collected):
                     logger.debug("deep_research assistant part[%d]: %s", i, seg)
-            except Exception:
-                pass
             text = "\n".join(collected).strip()
-        # Extract URL citation annotations if available
-        try:
+        # Extract URL citation annotations and inline-marker map in one pass
+        with contextlib.suppress(Exception):
             if last_msg is not None:
-                url_citations = _extract_url_citations_from_message(last_msg)
+                url_citations, marker_map = _extract_annotations(last_msg)
                 logger.debug("deep_research url_citation_annotations: %s", url_citations)
                 _debug_log_url_annotations(last_msg)
-        except Exception:
-            pass
     except Exception:
         pass
     finally:
-        try:
-            # Clean up ephemeral agent
+        # Clean up ephemeral agent
+        with contextlib.suppress(Exception):
             if hasattr(agents_svc, "delete_agent") and getattr(agent, "id", None):
                 agents_svc.delete_agent(getattr(agent, "id", None))
-        except Exception:
-            pass
 
-    try:
+    if logger.isEnabledFor(logging.DEBUG):
         logger.debug("deep_research assistant raw text:\n%s", text)
-    except Exception:
-        pass
     if not isinstance(text, str) or not text.strip():
         raise RuntimeError("Empty DeepResearch agent response")
 
-    title_line = next((line.strip("# ").strip() for line in text.splitlines() if line.startswith("# ")), None)
+    title_line = _extract_title_line(text)
     title = title_line or f"Deep Research Report: {', '.join(symbols) or 'Prompted'}"
     ann_citations: List[Dict[str, str]] = []
-    try:
-        marker_map = _build_marker_map(last_msg) if last_msg is not None else {}
-    except Exception:
-        marker_map = {}
     if marker_map:
-        try:
+        with contextlib.suppress(Exception):
             text_with_sup, ann_citations, _url_idx = _inject_superscripts_from_annotations(text, marker_map)
             if text_with_sup and text_with_sup != text:
                 text = text_with_sup
-        except Exception:
-            pass
     md = text
-    html = _md.render(md)
     citations: List[Dict[str, str]] = []
     seen_urls = set()
     # Prefer annotation-derived ordering for consistent numbering with superscripts
@@ -409,15 +709,9 @@ def _synthesize_with_deep_research(symbols: List[str], sources_per_symbol: List[
         if u and u not in seen_urls:
             citations.append({"title": t, "url": u})
             seen_urls.add(u)
-    for entry in sources_per_symbol:
-        for s in entry.get("sources") or []:
-            u = _normalize_url(s.get("url") or "")
-            t = s.get("title") or "Source"
-            if u and u not in seen_urls:
-                citations.append({"title": t, "url": u})
-                seen_urls.add(u)
+    _collect_citations(sources_per_symbol, citations, seen_urls)
     logger.debug("deep_research combined citations: %s", citations)
-    return {"title": title, "markdown": md, "html": html, "citations": citations}
+    return _LazyReport({"title": title, "markdown": md, "citations": citations})
 
 def _synthesize_with_agent(symbols: List[str], sources_per_symbol: List[Dict[str, Any]], user_prompt: Optional[str] = None) -> Dict[str, Any]:
     """
@@ -427,39 +721,43 @@ def _synthesize_with_agent(symbols: List[str], sources_per_symbol: List[Dict[str
     """
     prompt = _build_prompt(symbols, sources_per_symbol, user_prompt) if not user_prompt else user_prompt.strip()
 
+    _ensure_azure_sdk()
     # 1) Preferred path: Azure AI Projects SDK
     projects_endpoint, projects_project, agent_id = _resolve_projects_config("AgentMode")
-    logger.info(
-        "ai_projects gating: client=%s endpoint_set=%s project_set=%s agent_set=%s",
-        bool(AIProjectsClient), bool(projects_endpoint), bool(projects_project), bool(agent_id)
-    )
-    logger.info("ai_projects (AgentMode): endpoint=%r project=%r agent_id=%r", projects_endpoint, projects_project, agent_id)
-    # Extra diagnostics to trace why agent_set might be False
-    try:
-        logger.info("ai_projects Settings values: endpoint=%r project=%r agent_id=%r", projects_endpoint, projects_project, agent_id)
-        _env_ep = os.getenv("AZURE_AI_PROJECTS_ENDPOINT")
-        _env_pr = os.getenv("AZURE_AI_PROJECTS_PROJECT")
-        _env_ag = os.getenv("AZURE_AI_PROJECTS_AGENT_ID")
-        logger.info("ai_projects os.getenv values: endpoint=%r project=%r agent_id=%r", _env_ep, _env_pr, _env_ag)
-        _keys = [k for k in os.environ.keys() if k.startswith("AZURE_AI_PROJECTS")]
-        logger.info("ai_projects env keys present: %s", _keys)
-    except Exception as _e:
-        logger.info("ai_projects env dump failed: %s", repr(_e))
-    if not (AIProjectsClient and projects_endpoint and projects_project and agent_id):
+    # Gating diagnostics are config-derived and constant per process; log once.
+    global _gating_logged
+    if not _gating_logged:
+        _gating_logged = True
         logger.info(
-            "ai_projects not used: client=%s endpoint_set=%s project_set=%s agent_set=%s",
+            "ai_projects gating: client=%s endpoint_set=%s project_set=%s agent_set=%s",
             bool(AIProjectsClient), bool(projects_endpoint), bool(projects_project), bool(agent_id)
         )
+        logger.info("ai_projects (AgentMode): endpoint=%r project=%r agent_id=%r", projects_endpoint, projects_project, agent_id)
+        # Extra diagnostics to trace why agent_set might be False (debug-only:
+        # re-reading the env on every request is wasted work in production)
+        if logger.isEnabledFor(logging.DEBUG):
+            try:
+                _env_ep = os.getenv("AZURE_AI_PROJECTS_ENDPOINT")
+                _env_pr = os.getenv("AZURE_AI_PROJECTS_PROJECT")
+                _env_ag = os.getenv("AZURE_AI_PROJECTS_AGENT_ID")
+                logger.debug("ai_projects os.getenv values: endpoint=%r project=%r agent_id=%r", _env_ep, _env_pr, _env_ag)
+                _keys = [k for k in os.environ.keys() if k.startswith("AZURE_AI_PROJECTS")]
+                logger.debug("ai_projects env keys present: %s", _keys)
+            except Exception as _e:
+                logger.debug("ai_projects env dump failed: %s", repr(_e))
+        if not (AIProjectsClient and projects_endpoint and projects_project and agent_id):
+            logger.info(
+                "ai_projects not used: client=%s endpoint_set=%s project_set=%s agent_set=%s",
+                bool(AIProjectsClient), bool(projects_endpoint), bool(projects_project), bool(agent_id)
+            )
     if AIProjectsClient and projects_endpoint and projects_project and agent_id:
-        logger.info("openai_agent: using Azure AI Projects Agents path")
+        logger.debug("openai_agent: using Azure AI Projects Agents path")
         try:
-            logger.info("ai_projects: creating DefaultAzureCredential and AIProjectsClient (endpoint=%s, project_set=%s)", projects_endpoint, bool(projects_project))
-            cred = DefaultAzureCredential(exclude_interactive_browser_credential=False)
-            client = AIProjectsClient(endpoint=projects_endpoint, credential=cred)
-            
+            client = _get_projects_client(projects_endpoint, projects_project)
+
             # Validate agent exists
             agent = client.agents.get_agent(agent_id=agent_id)
-            logger.info("ai_projects: got agent response (id=%s)", agent.id if agent else "none")
+            logger.debug("ai_projects: got agent response (id=%s)", agent.id if agent else "none")
             if not getattr(agent, "id", None):
                 raise RuntimeError("Agent not found")
 
@@ -469,92 +767,74 @@ def _synthesize_with_agent(symbols: List[str], sources_per_symbol: List[Dict[str
             ) if (AgentThreadCreationOptions and ThreadMessageOptions) else {
                 "messages": [{"role": "user", "content": prompt}]
             }
-            logger.info("ai_projects: calling agents.create_thread_and_process_run on agent_id=%s", agent_id)
+            logger.debug("ai_projects: calling agents.create_thread_and_process_run on agent_id=%s", agent_id)
             run = client.agents.create_thread_and_process_run(
                 agent_id=agent_id,
                 thread=thread_payload,
             )
-            # Collect assistant messages from the completed thread
+            # Collect assistant output from the completed thread. Prefer the
+            # single-message lookup (one small REST call) over listing and
+            # scanning the whole thread, mirroring the deep-research path.
             text = ""
-            messages = client.agents.messages.list(
-                thread_id=getattr(run, "thread_id", None),
-                order=(ListSortOrder.ASCENDING if ListSortOrder else None),
-            )
+            msgs_svc = client.agents.messages
+            last_msg = None
+            if hasattr(msgs_svc, "get_last_message_by_role"):
+                try:
+                    last_msg = msgs_svc.get_last_message_by_role(
+                        thread_id=getattr(run, "thread_id", None), role="assistant"
+                    )
+                except Exception:
+                    last_msg = None
+            if last_msg is not None:
+                assistant_msgs = [last_msg]
+            else:
+                # Newest-first, stop at the first assistant message; matches
+                # the single-message semantics of get_last_message_by_role.
+                messages = msgs_svc.list(
+                    thread_id=getattr(run, "thread_id", None),
+                    order=(ListSortOrder.DESCENDING if ListSortOrder else None),
+                )
+                last = next((m for m in messages if getattr(m, "role", "") == "assistant"), None)
+                assistant_msgs = [last] if last is not None else []
             url_citations: List[Dict[str, str]] = []
             marker_map: Dict[str, Dict[str, str]] = {}
             collected: List[str] = []
-            for msg in messages:
-                if getattr(msg, "role", "") != "assistant":
-                    continue
+            for msg in assistant_msgs:
                 # Collect URL citation annotations if available
-                try:
-                    anns = _extract_url_citations_from_message(msg)
+                with contextlib.suppress(Exception):
+                    anns, mm = _extract_annotations(msg)
                     if anns:
                         url_citations.extend(anns)
+                    for k, v in mm.items():
+                        marker_map.setdefault(k, v)
                     _debug_log_url_annotations(msg)
-                    try:
-                        mm = _build_marker_map(msg)
-                        if mm:
-                            for k, v in mm.items():
-                                if k not in marker_map:
-                                    marker_map[k] = v
-                    except Exception:
-                        pass
-                except Exception:
-                    pass
-                try:
-                    if hasattr(msg, "text_messages") and msg.text_messages:
-                        for t in msg.text_messages:
-                            val = getattr(getattr(t, "text", None), "value", "") or ""
-                            if val and (not collected or collected[-1] != val):
-                                collected.append(val)
-                    else:
-                        for part in getattr(msg, "content", []) or []:
-                            if (MessageTextContent is not None) and isinstance(part, MessageTextContent):
-                                val = getattr(getattr(part, "text", None), "value", "") or ""
-                            elif isinstance(part, dict):
-                                val = (part.get("text", {}) or {}).get("value", "") or ""
-                            elif isinstance(part, str):
-                                val = part
-                            else:
-                                val = ""
-                            if val and (not collected or collected[-1] != val):
-                                collected.append(val)
-                except Exception:
-                    pass
+                with contextlib.suppress(Exception):
+                    for val in _message_text_parts(msg):
+                        if not collected or collected[-1] != val:
+                            collected.append(val)
             if collected:
-                try:
+                if logger.isEnabledFor(logging.DEBUG):
                     for i, seg in enumerate(collected):
                         logger.debug("agent assistant part[%d]: %s", i, seg)
-                except Exception:
-                    pass
                 text = "\n".join(collected).strip()
             if not text:
                 text = getattr(run, "output_text", None) or getattr(run, "content", None) or ""
-            try:
+            if logger.isEnabledFor(logging.DEBUG):
                 logger.debug("agent raw assistant text length=%d", len(text or ""))
-            except Exception:
-                pass
-            try:
                 logger.debug("agent assistant raw text:\n%s", text)
-            except Exception:
-                pass
-            
+
             if not isinstance(text, str) or not text.strip():
                 raise RuntimeError("Empty agent response")
 
-            title_line = next((line.strip("# ").strip() for line in text.splitlines() if line.startswith("# ")), None)
+            title_line = _extract_title_line(text)
             title = title_line or f"Deep Research Report: {', '.join(symbols) or 'Prompted'}"
             ann_citations: List[Dict[str, str]] = []
-            try:
+            with contextlib.suppress(Exception):
                 if marker_map:
                     text_with_sup, ann_citations, _url_idx = _inject_superscripts_from_annotations(text, marker_map)
                     if text_with_sup and text_with_sup != text:
                         text = text_with_sup
-            except Exception:
-                pass
             md = text
-            html = _md.render(md)
             citations: List[Dict[str, str]] = []
             seen_urls = set()
             # Prefer annotation-derived ordering
@@ -570,48 +850,42 @@ def _synthesize_with_agent(symbols: List[str], sources_per_symbol: List[Dict[str
                 if u and u not in seen_urls:
                     citations.append({"title": t, "url": u})
                     seen_urls.add(u)
-            for entry in sources_per_symbol:
-                for s in entry.get("sources") or []:
-                    u = _normalize_url(s.get("url") or "")
-                    t = s.get("title") or "Source"
-                    if u and u not in seen_urls:
-                        citations.append({"title": t, "url": u})
-                        seen_urls.add(u)
+            _collect_citations(sources_per_symbol, citations, seen_urls)
             logger.debug("agent combined citations: %s", citations)
-            return {"title": title, "markdown": md, "html": html, "citations": citations}
+            return _LazyReport({"title": title, "markdown": md, "citations": citations})
         except Exception as e:
             logger.warning("openai_agent: Azure AI Projects Agents path failed: %s", repr(e))
             # fall through to Azure OpenAI Assistants
             pass
 
     # 2) Fallback path: Azure OpenAI Assistants via AzureOpenAI using API key if available, else AAD token
-    endpoint = Settings.AZURE_OPENAI_ENDPOINT
-    api_version = Settings.AZURE_OPENAI_API_VERSION
-    api_key = Settings.AZURE_OPENAI_API_KEY
-    assistant_id = Settings.AZURE_OAI_ASSISTANT_ID
+    endpoint = _AOAI_ENDPOINT
+    api_version = _AOAI_API_VERSION
+    api_key = _AOAI_API_KEY
+    assistant_id = _AOAI_ASSISTANT_ID
     if AzureOpenAI and endpoint and assistant_id:
-        client = None
-        if api_key:
-            logger.info("openai_agent: using Azure OpenAI Assistants with API key")
-            client = AzureOpenAI(azure_endpoint=endpoint, api_version=api_version, api_key=api_key)
-        else:
-            logger.info("openai_agent: using Azure OpenAI Assistants with AAD token")
-            cred = DefaultAzureCredential(exclude_interactive_browser_credential=False)
-            token = cred.get_token("https://cognitiveservices.azure.com/.default").token
-            client = AzureOpenAI(azure_endpoint=endpoint, api_version=api_version, azure_ad_token=token)
+        logger.debug("openai_agent: using Azure OpenAI Assistants with %s", "API key" if api_key else "AAD token")
+        client = _get_aoai_client()
 
         thread = client.beta.threads.create()
         client.beta.threads.messages.create(thread_id=thread.id, role="user", content=prompt)
         run = client.beta.threads.runs.create(thread_id=thread.id, assistant_id=assistant_id)
 
-        for _ in range(60):
+        # Poll with exponential backoff: fast checks right after submission
+        # (short runs finish quickly), capped at 2s, ~120s total budget.
+        delay = 0.25
+        deadline = time.monotonic() + 120.0
+        while True:
             run = client.beta.threads.runs.retrieve(thread_id=thread.id, run_id=run.id)
             status = getattr(run, "status", None)
             if status == "completed":
                 break
             if status in ("failed", "cancelled", "expired"):
                 raise RuntimeError(f"Assistant run status: {status}")
-            time.sleep(2)
+            if time.monotonic() >= deadline:
+                break
+            time.sleep(delay)
+            delay = min(delay * 1.6, 2.0)
 
         msgs = client.beta.threads.messages.list(thread_id=thread.id)
         text = ""
@@ -635,81 +909,342 @@ def _synthesize_with_agent(symbols: List[str], sources_per_symbol: List[Dict[str
         if not text:
             raise RuntimeError("No assistant response content")
 
-        title_line = next((line.strip("# ").strip() for line in text.splitlines() if line.startswith("# ")), None)
+        title_line = _extract_title_line(text)
         title = title_line or f"Deep Research Report: {', '.join(symbols) or 'Prompted'}"
         md = text
-        html = _md.render(md)
-
-        citations: List[Dict[str, str]] = []
-        for entry in sources_per_symbol:
-            for s in entry.get("sources") or []:
-                u = _normalize_url(s.get("url") or "")
-                t = s.get("title") or "Source"
-                if u:
-                    citations.append({"title": t, "url": u})
 
-        return {"title": title, "markdown": md, "html": html, "citations": citations}
+        citations = _collect_citations(sources_per_symbol)
+
+        return _LazyReport({"title": title, "markdown": md, "citations": citations})
 
     # If both strategies fail
     raise RuntimeError("Agent not configured")
 
+# Invariant prompt scaffolding, hoisted so _build_prompt only formats the
+# dynamic middle section per call.
+_PROMPT_HEADER = "You are an expert research assistant.\n\n"
+_PROMPT_FOOTER = (
+    "Output markdown with sections: Overview, Recent Developments, Financials, Risks, Outlook.\n"
+    "Cite sources inline as [n] and provide a Citations list at the end with title + URL."
+)
+
+def _token_budget(symbols: List[str]) -> int:
+    """Scale max_tokens with the number of symbols instead of always
+    reserving the full 2000 — small requests finish sooner and more of
+    them fit under TPM limits. Prompt-only runs have no symbol count to
+    scale by and get the full budget."""
+    if not symbols:
+        return 2000
+    return max(400, min(2000, 400 + 250 * len(symbols)))
+
+# One pre-concatenated template per (user_prompt?, symbols?) shape; %-style
+# placeholders are safe for arbitrary user text (no brace escaping needed).
+_PROMPT_TEMPLATES = {
+    (False, False): _PROMPT_HEADER + _PROMPT_FOOTER,
+    (True, False): _PROMPT_HEADER + "User Research Prompt:\n%s\n\n" + _PROMPT_FOOTER,
+    (False, True): _PROMPT_HEADER + "Symbols: %s\n\n" + _PROMPT_FOOTER,
+    (True, True): _PROMPT_HEADER + "User Research Prompt:\n%s\n\nSymbols: %s\n\n" + _PROMPT_FOOTER,
+}
+
+@functools.lru_cache(maxsize=64)
+def _build_prompt_cached(symbols: Tuple[str, ...], user_prompt: Optional[str]) -> str:
+    has_up, has_syms = bool(user_prompt), bool(symbols)
+    tmpl = _PROMPT_TEMPLATES[(has_up, has_syms)]
+    if has_up and has_syms:
+        return tmpl % (user_prompt, ", ".join(symbols))
+    if has_up:
+        return tmpl % (user_prompt,)
+    if has_syms:
+        return tmpl % (", ".join(symbols),)
+    return tmpl
+
 def _build_prompt(symbols: List[str], sources_per_symbol: List[Dict[str, Any]], user_prompt: Optional[str] = None) -> str:
-    lines: List[str] = []
-    lines.append("You are an expert research assistant.")
-    lines.append("")
-    if user_prompt:
-        lines.append("User Research Prompt:")
-        lines.append(user_prompt)
-        lines.append("")
-
-    if symbols:
-        lines.append(f"Symbols: {', '.join(symbols)}")
-        lines.append("")
-    
-    lines.append("Output markdown with sections: Overview, Recent Developments, Financials, Risks, Outlook.")
-    lines.append("Cite sources inline as [n] and provide a Citations list at the end with title + URL.")
-    return "\n".join(lines)
+    # The prompt depends only on symbols and the user prompt (sources feed
+    # citations, not the prompt), so fallback retries with the same inputs
+    # hit the memoized builder.
+    return _build_prompt_cached(tuple(symbols or ()), user_prompt or None)
+
+# Max characters of a source excerpt quoted into the fallback report.
+_EXCERPT_LIMIT = 300
 
 def _fallback_report(symbols: List[str], sources_per_symbol: List[Dict[str, Any]], user_prompt: Optional[str] = None) -> Tuple[str, str, List[Dict[str, str]]]:
     title = f"Deep Research Report: {', '.join(symbols) or 'Prompted'}"
     citations: List[Dict[str, str]] = []
-    idx = 1
-    sections: List[str] = [f"# {title}", ""]
-    sections.append("## Overview")
-    sections.append("This is a locally generated summary.")
-    if user_prompt:
-        sections.append("")
-        sections.append("## User Prompt")
-        sections.append(user_prompt)
-        sections.append("")
-    sections.append("")
+    seen_excerpts: set = set()
+    idx = itertools.count(1)
+    body_lines: List[str] = []
     for entry in sources_per_symbol:
         sym = entry.get("symbol") or ""
-        sections.append(f"## {sym} - Recent Sources")
+        body_lines.append(f"## {sym} - Recent Sources")
         for s in entry.get("sources") or []:
             t = s.get("title") or "Source"
             u = _normalize_url(s.get("url") or "")
-            ex = (s.get("excerpt") or "").strip()
+            # Slice before strip so a multi-KB excerpt is never copied whole
+            ex = (s.get("excerpt") or "")[:_EXCERPT_LIMIT + 64].strip()[:_EXCERPT_LIMIT]
             if u:
                 citations.append({"title": t, "url": u})
-                sections.append(f"- {t} [{idx}]")
-                if ex:
-                    sections.append(f"  - {ex[:300]}")
-                idx += 1
-        sections.append("")
+                body_lines.append(f"- {t} [{next(idx)}]")
+                if ex and ex not in seen_excerpts:
+                    seen_excerpts.add(ex)
+                    body_lines.append(f"  - {ex}")
+        body_lines.append("")
+
+    user_block = f"\n## User Prompt\n{user_prompt}\n" if user_prompt else ""
+    parts = [f"# {title}\n\n## Overview\nThis is a locally generated summary.{user_block}\n"]
+    parts.extend(body_lines)
     if citations:
-        sections.append("## Citations")
-        for i, c in enumerate(citations, start=1):
-            t = c.get("title") or "Source"
-            u = c.get("url") or ""
-            sections.append(f"[{i}] [{t}]({u})")
-    md = "\n".join(sections)
-    return title, md, citations
-
-def synthesize_report(symbols: List[str], sources_per_symbol: List[Dict[str, Any]], user_prompt: Optional[str] = None, deep_research: bool = False) -> Dict[str, Any]:
+        parts.append("## Citations")
+        parts.extend(
+            f"[{i}] [{c.get('title') or 'Source'}]({c.get('url') or ''})"
+            for i, c in enumerate(citations, start=1)
+        )
+    return title, "\n".join(parts), citations
+
+async def _synthesize_per_symbol_async(symbols: List[str], sources_per_symbol: List[Dict[str, Any]], user_prompt: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Fan out one Chat Completions request per symbol and gather concurrently,
+    so wall-clock latency is max(per-symbol) instead of one serial mega-prompt.
+    """
+    if AsyncAzureOpenAI is None:
+        raise RuntimeError("AsyncAzureOpenAI not available")
+    endpoint = _AOAI_ENDPOINT
+    deployment = _AOAI_DEPLOYMENT
+    api_key = _AOAI_API_KEY
+    if not (api_key and endpoint and deployment):
+        raise RuntimeError("Azure OpenAI not configured")
+
+    sources_by_symbol = {e.get("symbol"): e for e in sources_per_symbol}
+    client = _get_aoai_async_client()
+
+    async def _one(sym: str):
+        entry = sources_by_symbol.get(sym) or {"symbol": sym, "sources": []}
+        prompt = _build_prompt([sym], [entry], user_prompt)
+        kwargs = dict(
+            model=deployment,
+            messages=[
+                {"role": "system", "content": "You are a helpful financial research assistant."},
+                {"role": "user", "content": prompt},
+            ],
+            temperature=0.2,
+            max_tokens=_token_budget([sym]),
+        )
+        # Same retry policy as the sync _chat_completions_create wrapper.
+        if AsyncRetrying is None or not _RETRYABLE_ERRORS:
+            return await client.chat.completions.create(**kwargs)
+        async for attempt in AsyncRetrying(
+            retry=retry_if_exception_type(_RETRYABLE_ERRORS),
+            wait=_wait_retry_after,
+            stop=stop_after_attempt(3),
+            reraise=True,
+        ):
+            with attempt:
+                return await client.chat.completions.create(**kwargs)
+    completions = await asyncio.gather(*[_one(s) for s in symbols])
+
+    sections: List[str] = []
+    for sym, completion in zip(symbols, completions):
+        text = (completion.choices[0].message.content or "").strip()
+        if text:
+            sections.append(text)
+    if not sections:
+        raise RuntimeError("Empty completion")
+
+    title = f"Deep Research Report: {', '.join(symbols)}"
+    md = f"# {title}\n\n" + "\n\n".join(sections)
+
+    citations = _collect_citations(sources_per_symbol)
+
+    return _LazyReport({"title": title, "markdown": md, "citations": citations})
+
+# In-process exact-match cache for synthesized reports. Inputs plus
+# temperature fully determine the output, so identical requests within a
+# worker's lifetime can skip the LLM round trip. Set SYNTH_CACHE=0 to disable.
+_REPORT_CACHE: OrderedDict = OrderedDict()
+_REPORT_CACHE_MAX = 256
+
+def _report_cache_key(symbols: List[str], sources_per_symbol: List[Dict[str, Any]], user_prompt: Optional[str], deep_research: bool, parallel: bool) -> str:
+    payload = {
+        "s": sorted(symbols or []),
+        "p": user_prompt or "",
+        "dr": bool(deep_research),
+        "par": bool(parallel),
+        "src": [
+            (e.get("symbol") or e.get("prompt") or "",
+             sorted((s.get("url") or "") for s in (e.get("sources") or [])))
+            for e in (sources_per_symbol or [])
+        ],
+    }
+    return hashlib.blake2b(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+def synthesize_report(symbols: List[str], sources_per_symbol: List[Dict[str, Any]], user_prompt: Optional[str] = None, deep_research: bool = False, parallel: bool = False) -> Dict[str, Any]:
     """
     Returns: {"title": str, "markdown": str, "html": str, "citations": [...]}
+    Results are cached in-process by exact input fingerprint.
+    """
+    # Nothing to research: no symbols, no prompt, no sources. The LLM would
+    # only produce a content-free response, so skip the round trip entirely.
+    if not symbols and not user_prompt and not any(e.get("sources") for e in (sources_per_symbol or [])):
+        title, md, citations = _fallback_report(symbols or [], sources_per_symbol or [], user_prompt)
+        return _LazyReport({"title": title, "markdown": md, "citations": citations})
+
+    if os.getenv("SYNTH_CACHE", "1") == "0":
+        return _synthesize_report_uncached(symbols, sources_per_symbol, user_prompt, deep_research, parallel)
+
+    key = _report_cache_key(symbols, sources_per_symbol, user_prompt, deep_research, parallel)
+    hit = _REPORT_CACHE.get(key)
+    if hit is not None:
+        _REPORT_CACHE.move_to_end(key)
+        logger.debug("synthesize_report: cache hit, skipping LLM call")
+        # Copy as _LazyReport so the cached HTML (if already rendered) is
+        # reused and an unrendered hit still renders on demand.
+        return _LazyReport(hit)
+
+    result = _synthesize_report_uncached(symbols, sources_per_symbol, user_prompt, deep_research, parallel)
+    if isinstance(result, dict) and result.get("markdown"):
+        _REPORT_CACHE[key] = result
+        if len(_REPORT_CACHE) > _REPORT_CACHE_MAX:
+            _REPORT_CACHE.popitem(last=False)
+    return result
+
+def synthesize_report_stream(symbols: List[str], sources_per_symbol: List[Dict[str, Any]], user_prompt: Optional[str] = None):
+    """
+    Streaming variant of the Chat Completions path: yields markdown text
+    chunks as the model produces them so callers can flush output at
+    first-token latency, then yields one final dict with the assembled
+    {"title", "markdown", "html", "citations"} payload.
+    """
+    deployment = _AOAI_DEPLOYMENT
+    if not (AzureOpenAI and _AOAI_ENDPOINT and deployment):
+        raise RuntimeError("Azure OpenAI not configured")
+
+    prompt = _build_prompt(symbols, sources_per_symbol, user_prompt)
+    client = _get_aoai_client()
+    stream = _chat_completions_create(
+        client,
+        model=deployment,
+        messages=[
+            {"role": "system", "content": "You are a helpful financial research assistant."},
+            {"role": "user", "content": prompt},
+        ],
+        temperature=0.2,
+        max_tokens=_token_budget(symbols),
+        stream=True,
+    )
+    parts: List[str] = []
+    for chunk in stream:
+        try:
+            delta = chunk.choices[0].delta.content or ""
+        except (AttributeError, IndexError):
+            delta = ""
+        if delta:
+            parts.append(delta)
+            yield delta
+
+    text = "".join(parts).strip()
+    if not text:
+        raise RuntimeError("Empty completion")
+    title = _extract_title_line(text) or f"Deep Research Report: {', '.join(symbols) or 'Prompted'}"
+    yield _LazyReport({
+        "title": title,
+        "markdown": text,
+        "citations": _collect_citations(sources_per_symbol),
+    })
+
+async def synthesize_report_async(symbols: List[str], sources_per_symbol: List[Dict[str, Any]], user_prompt: Optional[str] = None, deep_research: bool = False, parallel: bool = False) -> Dict[str, Any]:
+    """
+    Async facade over synthesize_report for event-loop callers (async HTTP
+    handlers and activities). The whole pipeline — whose SDK surface here is
+    sync, including the agent polling loops — runs on a worker thread so the
+    event loop is never pinned for the duration of a run. Delegating keeps
+    the report cache and the strategy order intact: the per-symbol parallel
+    path stays a fallback after the agents attempt, not a shortcut past it.
+    """
+    return await asyncio.to_thread(
+        synthesize_report, symbols, sources_per_symbol, user_prompt, deep_research, parallel
+    )
+
+def synthesize_report_batch(jobs: List[Dict[str, Any]], poll_interval: float = 30.0, timeout: float = 24 * 3600.0) -> Dict[str, Dict[str, Any]]:
     """
+    Submit many non-interactive synthesis jobs through the Azure OpenAI Batch
+    API (24h completion window; sidesteps per-request RPM limits and costs
+    less than real-time). Each job: {"id": str?, "symbols": [...],
+    "sources": [...], "prompt": str?}. Blocks until the batch finishes and
+    returns {custom_id: report dict} ({"error": ...} for failed entries).
+    """
+    deployment = _AOAI_DEPLOYMENT
+    if not (AzureOpenAI and _AOAI_ENDPOINT and deployment):
+        raise RuntimeError("Azure OpenAI not configured")
+    client = _get_aoai_client()
+
+    lines: List[str] = []
+    job_inputs: Dict[str, Tuple[List[str], List[Dict[str, Any]]]] = {}
+    for i, job in enumerate(jobs):
+        custom_id = str(job.get("id") or f"job-{i}")
+        symbols = job.get("symbols") or []
+        sources = job.get("sources") or []
+        job_inputs[custom_id] = (symbols, sources)
+        lines.append(json.dumps({
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": "/chat/completions",
+            "body": {
+                "model": deployment,
+                "messages": [
+                    {"role": "system", "content": "You are a helpful financial research assistant."},
+                    {"role": "user", "content": _build_prompt(symbols, sources, job.get("prompt") or None)},
+                ],
+                "temperature": 0.2,
+                "max_tokens": _token_budget(symbols),
+            },
+        }))
+    if not lines:
+        return {}
+
+    batch_file = client.files.create(
+        file=("batch_input.jsonl", "\n".join(lines).encode("utf-8")),
+        purpose="batch",
+    )
+    batch = client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/chat/completions",
+        completion_window="24h",
+    )
+    logger.info("synthesize_report_batch: submitted batch %s with %d jobs", batch.id, len(lines))
+
+    deadline = time.monotonic() + timeout
+    while getattr(batch, "status", None) not in ("completed", "failed", "expired", "cancelled"):
+        if time.monotonic() >= deadline:
+            raise RuntimeError(f"Batch {batch.id} did not finish in time (status: {getattr(batch, 'status', None)})")
+        time.sleep(poll_interval)
+        batch = client.batches.retrieve(batch.id)
+    if getattr(batch, "status", None) != "completed" or not getattr(batch, "output_file_id", None):
+        raise RuntimeError(f"Batch {batch.id} status: {getattr(batch, 'status', None)}")
+
+    results: Dict[str, Dict[str, Any]] = {}
+    for line in client.files.content(batch.output_file_id).text.splitlines():
+        if not line.strip():
+            continue
+        try:
+            rec = json.loads(line)
+        except Exception:
+            continue
+        custom_id = rec.get("custom_id") or ""
+        body = (rec.get("response") or {}).get("body") or {}
+        choices = body.get("choices") or []
+        text = ((choices[0].get("message") or {}).get("content") or "").strip() if choices else ""
+        symbols, sources = job_inputs.get(custom_id, ([], []))
+        if not text:
+            results[custom_id] = {"error": rec.get("error") or "empty completion"}
+            continue
+        title = _extract_title_line(text) or f"Deep Research Report: {', '.join(symbols) or 'Prompted'}"
+        results[custom_id] = _LazyReport({
+            "title": title,
+            "markdown": text,
+            "citations": _collect_citations(sources),
+        })
+    return results
+
+def _synthesize_report_uncached(symbols: List[str], sources_per_symbol: List[Dict[str, Any]], user_prompt: Optional[str] = None, deep_research: bool = False, parallel: bool = False) -> Dict[str, Any]:
     if deep_research:
         try:
             return _synthesize_with_deep_research(symbols, sources_per_symbol, user_prompt)
@@ -717,16 +1252,16 @@ def synthesize_report(symbols: List[str], sources_per_symbol: List[Dict[str, Any
             logger.warning("openai_agent: deep research path failed: %s", repr(e))
             # fall through to other strategies
 
-    endpoint = Settings.AZURE_OPENAI_ENDPOINT
-    api_version = Settings.AZURE_OPENAI_API_VERSION
-    deployment = Settings.AZURE_OPENAI_DEPLOYMENT
-    api_key = Settings.AZURE_OPENAI_API_KEY
+    endpoint = _AOAI_ENDPOINT
+    api_version = _AOAI_API_VERSION
+    deployment = _AOAI_DEPLOYMENT
+    api_key = _AOAI_API_KEY
 
     # 1) Prefer Azure AI Projects Agents if configured, else try Assistants
     try:
         _ep, _pr, _ag = _resolve_projects_config("AgentMode")
-        if (_ep and _pr and _ag) or (Settings.AZURE_OAI_ASSISTANT_ID and endpoint):
-            logger.info("openai_agent: attempting agent/assistants path")
+        if (_ep and _pr and _ag) or (_AOAI_ASSISTANT_ID and endpoint):
+            logger.debug("openai_agent: attempting agent/assistants path")
             return _synthesize_with_agent(symbols, sources_per_symbol, user_prompt)
     except Exception as e:
         logger.warning("openai_agent: agent/assistants path raised: %s", repr(e))
@@ -734,36 +1269,41 @@ def synthesize_report(symbols: List[str], sources_per_symbol: List[Dict[str, Any
         pass
 
     # 2) Fallback to Chat Completions with API key if configured
+    if parallel and len(symbols) > 1 and AsyncAzureOpenAI and api_key and endpoint and deployment:
+        logger.debug("openai_agent: using concurrent per-symbol Chat Completions")
+        try:
+            return asyncio.run(_synthesize_per_symbol_async(symbols, sources_per_symbol, user_prompt))
+        except Exception as e:
+            logger.warning("openai_agent: per-symbol parallel path failed: %s", repr(e))
+            # fall through to the single-prompt path
     if AzureOpenAI and api_key and endpoint and deployment:
-        logger.info("openai_agent: using Chat Completions with API key")
+        logger.debug("openai_agent: using Chat Completions with API key")
         prompt = _build_prompt(symbols, sources_per_symbol, user_prompt)
-        client = AzureOpenAI(api_key=api_key, api_version=api_version, azure_endpoint=endpoint)
+        client = _get_aoai_client()
         try:
-            completion = client.chat.completions.create(
+            completion = _chat_completions_create(
+                client,
                 model=deployment,
                 messages=[
                     {"role": "system", "content": "You are a helpful financial research assistant."},
                     {"role": "user", "content": prompt},
                 ],
                 temperature=0.2,
-                max_tokens=2000,
+                max_tokens=_token_budget(symbols),
             )
             text = (completion.choices[0].message.content or "").strip()
             if not text:
                 raise RuntimeError("Empty completion")
-            title_line = next((line.strip("# ").strip() for line in text.splitlines() if line.startswith("# ")), None)
+            title_line = _extract_title_line(text)
             title = title_line or f"Deep Research Report: {', '.join(symbols) or 'Prompted'}"
             md = text
-            html = _md.render(md)
+            citations = _collect_citations(sources_per_symbol)
+            return _LazyReport({"title": title, "markdown": md, "citations": citations})
+        except Exception as e:
+            logger.warning("openai_agent: chat completions path failed: %s", repr(e))
 
-            citations: List[Dict[str, str]] = []
-            for entry in sources_per_symbol:
-                for s in entry.get("sources") or []:
-                    u = _normalize_url(s.get("url") or "")
-                    t = s.get("title") or "Source"
-                    if u:
-                        citations.append({"title": t, "url": u})
-
-            return {"title": title, "markdown": md, "html": html, "citations": citations}
-        except Exception:
-            pass
+    # 3) Last resort: locally generated fallback. Like every branch above,
+    # the markdown is rendered at most once, on first access of "html";
+    # cached responses reuse the stored HTML rather than re-rendering.
+    title, md, citations = _fallback_report(symbols, sources_per_symbol, user_prompt)
+    return _LazyReport({"title": title, "markdown": md, "citations": citations})
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import hashlib
+import threading
+from collections import OrderedDict
 from io import BytesIO
 from typing import Optional, List
 
@@ -7,14 +10,35 @@ from reportlab.lib.pagesizes import LETTER
 from reportlab.lib.styles import getSampleStyleSheet
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
 
+# Paragraph parses a small HTML subset, so body text must escape markup
+# characters; one translate call does all three substitutions in a single
+# C-level pass.
+_HTML_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+# Generated-PDF cache keyed by content digest: retries and email resends
+# regenerate identical documents, and ReportLab layout is the expensive part.
+_PDF_CACHE: OrderedDict = OrderedDict()
+_PDF_CACHE_MAX = 50
+_pdf_lock = threading.Lock()
+
 def markdown_to_pdf_bytes(markdown_text: str, title: Optional[str] = None) -> bytes:
     """
     Very lightweight Markdown->PDF: renders text as paragraphs.
     Headings starting with '#' are bolded by simple styling heuristics.
     """
+    key = hashlib.blake2b(
+        f"{title or ''}\x00{markdown_text or ''}".encode("utf-8"), digest_size=16
+    ).digest()
+    with _pdf_lock:
+        cached = _PDF_CACHE.get(key)
+        if cached is not None:
+            _PDF_CACHE.move_to_end(key)
+            return cached
+
     buf = BytesIO()
     doc = SimpleDocTemplate(buf, pagesize=LETTER)
     styles = getSampleStyleSheet()
+    h_styles = {1: styles["Heading1"], 2: styles["Heading2"], 3: styles["Heading3"]}
     story: List = []
 
     if title:
@@ -27,20 +51,17 @@ def markdown_to_pdf_bytes(markdown_text: str, title: Optional[str] = None) -> by
         if not text:
             story.append(Spacer(1, 8))
             continue
-        # naive heading detection
-        if text.startswith("# "):
-            story.append(Paragraph(text.lstrip("# ").strip(), styles["Heading1"]))
-        elif text.startswith("## "):
-            story.append(Paragraph(text.lstrip("# ").strip(), styles["Heading2"]))
-        elif text.startswith("### "):
-            story.append(Paragraph(text.lstrip("# ").strip(), styles["Heading3"]))
+        # naive heading detection: count leading '#' once and look the
+        # style up by depth instead of three startswith scans
+        hashes = len(text) - len(text.lstrip("#"))
+        if 1 <= hashes <= 3 and text[hashes : hashes + 1] == " ":
+            story.append(Paragraph(text[hashes + 1 :].strip(), h_styles[hashes]))
         else:
-            # Paragraph supports a small HTML subset; escape angle brackets
-            safe = (
-                text.replace("&", "&")
-                .replace("<", "<")
-                .replace(">", ">")
-            )
-            story.append(Paragraph(safe, styles["BodyText"]))
+            story.append(Paragraph(text.translate(_HTML_ESCAPE), styles["BodyText"]))
     doc.build(story)
-    return buf.getvalue()
+    pdf = buf.getvalue()
+    with _pdf_lock:
+        _PDF_CACHE[key] = pdf
+        if len(_PDF_CACHE) > _PDF_CACHE_MAX:
+            _PDF_CACHE.popitem(last=False)
+    return pdf
@@ -1,8 +1,42 @@
 from __future__ import annotations
 
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List
 from ..common import bing
 
+# The symbol query shape is fixed, so hoist it once instead of re-building
+# the literal per invocation.
+_QUERY_TEMPLATE = "%s stock latest news earnings financial results analysis"
+
+# Search results per normalized symbol, cached for a short TTL: repeat
+# orchestrations for the same symbol within a couple of minutes (multiple
+# schedules, retries) bypass the Bing API call entirely.
+_SEARCH_CACHE: OrderedDict = OrderedDict()
+_SEARCH_CACHE_MAX = 512
+_SEARCH_CACHE_TTL = 120.0  # seconds
+_search_lock = threading.Lock()
+
+
+def _cached_symbol_search(symbol: str) -> List[Dict[str, str]]:
+    key = symbol.upper()
+    now = time.monotonic()
+    with _search_lock:
+        entry = _SEARCH_CACHE.get(key)
+        if entry is not None and now - entry[0] < _SEARCH_CACHE_TTL:
+            _SEARCH_CACHE.move_to_end(key)
+            return list(entry[1])
+
+    results = bing.web_search(_QUERY_TEMPLATE % symbol, top_k=6)
+    if results:
+        with _search_lock:
+            _SEARCH_CACHE[key] = (now, results)
+            if len(_SEARCH_CACHE) > _SEARCH_CACHE_MAX:
+                _SEARCH_CACHE.popitem(last=False)
+    return list(results)
+
 def main(input: Dict[str, Any]) -> List[Dict[str, str]]:
     """
     Activity: fetch_context
@@ -16,21 +50,23 @@ def main(input: Dict[str, Any]) -> List[Dict[str, str]]:
     symbol = (input.get("symbol") or "").strip()
 
     if prompt:
-        query = prompt
+        # Free-form prompts are effectively unique; search directly.
+        results = bing.web_search(prompt, top_k=6)
     elif symbol:
-        query = f"{symbol} stock latest news earnings financial results analysis"
+        results = _cached_symbol_search(symbol)
     else:
         return []
 
-    results = bing.web_search(query, top_k=6)
+    # Dedupe before fetching so a URL repeated across results is only
+    # downloaded once (dict.fromkeys keeps first-seen order).
+    urls = list(dict.fromkeys(r["url"] for r in results if r.get("url")))
+
+    # Fetch all pages concurrently; the work is network-bound, so wall time
+    # drops from the sum of round-trips to roughly the slowest fetch.
     sources: List[Dict[str, str]] = []
-    for r in results:
-        url = r.get("url")
-        if not url:
-            continue
-        extracted = bing.fetch_and_extract(url)
-        if extracted:
-            sources.append(extracted)
+    if urls:
+        with ThreadPoolExecutor(max_workers=min(8, len(urls))) as ex:
+            sources = [s for s in ex.map(bing.fetch_and_extract, urls) if s]
 
     # De-dup by URL
     seen = set()
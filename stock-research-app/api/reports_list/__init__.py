@@ -1,16 +1,17 @@
 # List reports for current user (HTTP GET /api/reports?scheduleId=...)
 from __future__ import annotations
 
-import json
+from itertools import islice
 from typing import Optional
 
 import azure.functions as func
 
 from ..common.auth import get_user_context
+from ..common import jsonio
 from ..common.cosmos import list_reports_for_user
 
 async def main(req: func.HttpRequest) -> func.HttpResponse:
-    user = get_user_context(dict(req.headers))
+    user = get_user_context(req.headers)
     user_id = user.get("userId") or "dev-user"
 
     schedule_id: Optional[str] = req.params.get("scheduleId")
@@ -20,9 +21,19 @@ async def main(req: func.HttpRequest) -> func.HttpResponse:
     except Exception:
         limit = 50
 
-    items = list(list_reports_for_user(user_id=user_id, schedule_id=schedule_id, limit=limit))
+    # Encode the array item-by-item while iterating the (lazy) Cosmos pages,
+    # so peak memory is one page plus the buffer rather than the whole result
+    # materialized twice. islice enforces limit as a hard cap regardless of
+    # what the store hands back.
+    items = list_reports_for_user(user_id=user_id, schedule_id=schedule_id, limit=limit)
+    buf = bytearray(b"[")
+    for i, item in enumerate(islice(items, max(0, limit))):
+        if i:
+            buf += b","
+        buf += jsonio.dumps(item)
+    buf += b"]"
     return func.HttpResponse(
-        json.dumps(items),
+        body=bytes(buf),
         status_code=200,
         mimetype="application/json",
     )
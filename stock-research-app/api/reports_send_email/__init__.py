@@ -1,19 +1,24 @@
 # Send email for an existing report (HTTP POST /api/reports/{id}/send-email)
 from __future__ import annotations
 
-import json
 import logging
+import re
 from typing import Dict, Any
 
 import azure.functions as func
 import azure.durable_functions as df
 
 from ..common.auth import get_user_context
+from ..common import jsonio
 from ..common.cosmos import get_report
 from ..common.config import Settings
 
 logger = logging.getLogger(__name__)
 
+# Compiled once; a bare '"@" in e' check let addresses like "@" or "a@"
+# through to the email service, wasting a send that can only fail.
+_EMAIL_RE = re.compile(r"^[^\s@]+@[^\s@]+\.[^\s@]+$")
+
 async def main(req: func.HttpRequest, starter: str) -> func.HttpResponse:
     """
     POST /api/reports/{id}/send-email
@@ -22,13 +27,13 @@ async def main(req: func.HttpRequest, starter: str) -> func.HttpResponse:
       "attachPdf": true/false (optional, default: true)
     }
     """
-    user = get_user_context(dict(req.headers))
+    user = get_user_context(req.headers)
     user_id = user.get("userId") or "dev-user"
 
     report_id = (req.route_params or {}).get("id")
     if not report_id:
         return func.HttpResponse(
-            json.dumps({"error": "report id is required in route"}),
+            jsonio.dumps({"error": "report id is required in route"}),
             status_code=400,
             mimetype="application/json",
         )
@@ -37,17 +42,17 @@ async def main(req: func.HttpRequest, starter: str) -> func.HttpResponse:
     doc = get_report(report_id, user_id)
     if not doc:
         return func.HttpResponse(
-            json.dumps({"error": "report not found"}),
+            jsonio.dumps({"error": "report not found"}),
             status_code=404,
             mimetype="application/json",
         )
 
     # Parse request body
     try:
-        body = req.get_json()
+        body = jsonio.loads(req.get_body())
     except Exception:
         return func.HttpResponse(
-            json.dumps({"error": "invalid JSON body"}),
+            jsonio.dumps({"error": "invalid JSON body"}),
             status_code=400,
             mimetype="application/json",
         )
@@ -55,16 +60,16 @@ async def main(req: func.HttpRequest, starter: str) -> func.HttpResponse:
     email_to = body.get("emailTo", [])
     if not email_to or not isinstance(email_to, list):
         return func.HttpResponse(
-            json.dumps({"error": "emailTo is required and must be an array"}),
+            jsonio.dumps({"error": "emailTo is required and must be an array"}),
             status_code=400,
             mimetype="application/json",
         )
 
     # Validate email addresses
-    valid_emails = [e for e in email_to if isinstance(e, str) and "@" in e and e.strip()]
+    valid_emails = [e.strip() for e in email_to if isinstance(e, str) and _EMAIL_RE.match(e.strip())]
     if not valid_emails:
         return func.HttpResponse(
-            json.dumps({"error": "no valid email addresses provided"}),
+            jsonio.dumps({"error": "no valid email addresses provided"}),
             status_code=400,
             mimetype="application/json",
         )
@@ -84,7 +89,7 @@ async def main(req: func.HttpRequest, starter: str) -> func.HttpResponse:
     if not Settings.ACS_CONNECTION_STRING or not Settings.EMAIL_SENDER:
         logger.warning(f"Email service not configured. Report: {report_id}")
         return func.HttpResponse(
-            json.dumps({
+            jsonio.dumps({
                 "error": "Email service not configured",
                 "reportId": report_id
             }),
@@ -104,7 +109,7 @@ async def main(req: func.HttpRequest, starter: str) -> func.HttpResponse:
     logger.info(f"Started email send orchestration {instance_id} for report {report_id} to {len(valid_emails)} recipient(s)")
 
     return func.HttpResponse(
-        json.dumps({
+        jsonio.dumps({
             "message": "Email send initiated",
             "reportId": report_id,
             "instanceId": instance_id,
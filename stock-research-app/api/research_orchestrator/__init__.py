@@ -28,9 +28,11 @@ def orchestrator_function(context: df.DurableOrchestrationContext):
 
     sources_per_symbol = []
     if symbols:
-        for s in symbols:
-            src = yield context.call_activity("fetch_context", {"symbol": s})
-            sources_per_symbol.append({"symbol": s, "sources": src})
+        # Fan out one fetch_context activity per symbol and wait for all of
+        # them, so context gathering runs concurrently instead of serially.
+        tasks = [context.call_activity("fetch_context", {"symbol": s}) for s in symbols]
+        results = yield context.task_all(tasks)
+        sources_per_symbol = [{"symbol": s, "sources": src} for s, src in zip(symbols, results)]
     elif prompt:
         src = yield context.call_activity("fetch_context", {"prompt": prompt})
         sources_per_symbol.append({"prompt": prompt, "sources": src})
@@ -58,8 +60,11 @@ def orchestrator_function(context: df.DurableOrchestrationContext):
     })
 
     if saved.get("emailTo"):
-        email_result = yield context.call_activity("send_email", saved)
-        logger.info(f"Orchestrator: Email send result: {email_result}")
+        # Hand the send off to its own orchestration via a short activity
+        # with a client binding: this SDK only schedules tasks that are
+        # yielded, so an un-yielded sub-orchestrator call would never run.
+        # The parent waits only for the start call, not for the send itself.
+        yield context.call_activity("start_email_orchestration", saved)
 
     return {"status": "ok", "reportId": saved.get("reportId"), "runId": run_id, "scheduleId": schedule_id}
 
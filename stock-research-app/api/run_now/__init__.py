@@ -1,24 +1,24 @@
 # Run a schedule now (HTTP POST /api/schedules/{id}/run)
 from __future__ import annotations
 
-import json
 from typing import Any, Dict
 
 import azure.functions as func
 import azure.durable_functions as df
 
 from ..common.auth import get_user_context
+from ..common import jsonio
 from ..common.models import Run
 from ..common.cosmos import get_schedule as cosmos_get_schedule, create_run as cosmos_create_run
 
 async def main(req: func.HttpRequest, starter: str) -> func.HttpResponse:
-    user = get_user_context(dict(req.headers))
+    user = get_user_context(req.headers)
     user_id = user.get("userId") or "dev-user"
 
     schedule_id = (req.route_params or {}).get("id")
     if not schedule_id:
         return func.HttpResponse(
-            json.dumps({"error": "schedule id is required in route"}),
+            jsonio.dumps({"error": "schedule id is required in route"}),
             status_code=400,
             mimetype="application/json",
         )
@@ -26,7 +26,7 @@ async def main(req: func.HttpRequest, starter: str) -> func.HttpResponse:
     sched = cosmos_get_schedule(schedule_id, user_id)
     if not sched:
         return func.HttpResponse(
-            json.dumps({"error": "schedule not found"}),
+            jsonio.dumps({"error": "schedule not found"}),
             status_code=404,
             mimetype="application/json",
         )
@@ -59,7 +59,7 @@ async def main(req: func.HttpRequest, starter: str) -> func.HttpResponse:
     instance_id = await client.start_new("research_orchestrator", None, orch_input)
 
     return func.HttpResponse(
-        json.dumps({
+        jsonio.dumps({
             "instanceId": instance_id,
             "runId": run_doc["id"],
             "scheduleId": schedule_id
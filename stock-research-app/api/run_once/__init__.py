@@ -2,27 +2,27 @@
 # Does not create a schedule - just runs a one-off research report
 from __future__ import annotations
 
-import json
 from typing import Any, Dict, List
 
 import azure.functions as func
 import azure.durable_functions as df
 
 from ..common.auth import get_user_context
+from ..common import jsonio
 from ..common.models import Run
 from ..common.cosmos import create_run as cosmos_create_run
 
 
 async def main(req: func.HttpRequest, starter: str) -> func.HttpResponse:
-    user = get_user_context(dict(req.headers))
+    user = get_user_context(req.headers)
     user_id = user.get("userId") or "dev-user"
 
     # Parse request body
     try:
-        body = req.get_json() or {}
+        body = jsonio.loads(req.get_body() or b"{}") or {}
     except ValueError:
         return func.HttpResponse(
-            json.dumps({"error": "Invalid JSON body"}),
+            jsonio.dumps({"error": "Invalid JSON body"}),
             status_code=400,
             mimetype="application/json",
         )
@@ -36,7 +36,7 @@ async def main(req: func.HttpRequest, starter: str) -> func.HttpResponse:
     # Validate: need at least symbols or prompt
     if not symbols and not prompt:
         return func.HttpResponse(
-            json.dumps({"error": "Either 'symbols' or 'prompt' is required"}),
+            jsonio.dumps({"error": "Either 'symbols' or 'prompt' is required"}),
             status_code=400,
             mimetype="application/json",
         )
@@ -61,7 +61,7 @@ async def main(req: func.HttpRequest, starter: str) -> func.HttpResponse:
     instance_id = await client.start_new("research_orchestrator", None, orch_input)
 
     return func.HttpResponse(
-        json.dumps({
+        jsonio.dumps({
             "instanceId": instance_id,
             "runId": run_doc["id"],
             "message": "One-off research started"
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any
 from datetime import datetime, timezone
 from ..common.config import Settings
@@ -50,20 +52,34 @@ def main(input: Dict[str, Any]) -> Dict[str, Any]:
     attach_pdf = bool(input.get("attachPdf", False))
 
     container = Settings.REPORTS_CONTAINER or "reports"
-    # {userId}/{scheduleId}/{runId}/report.* (path within the container)
-    prefix = f"{user_id}/{schedule_id}/{run_id}".replace("//", "/")
+    # {userId}/{scheduleId}/{runId}/report.* (path within the container);
+    # joining only non-empty segments avoids the old replace("//", "/")
+    # rescan and stops an empty id from silently collapsing the layout.
+    prefix = "/".join(p for p in (user_id, schedule_id, run_id) if p)
     md_path = f"{prefix}/report.md"
     html_path = f"{prefix}/report.html"
 
-    md_url = blob_util.upload_text(container, md_path, md, content_type="text/markdown; charset=utf-8")
-    html_url = blob_util.upload_text(container, html_path, html, content_type="text/html; charset=utf-8")
-
     pdf_path = None
-    pdf_url = None
-    if attach_pdf:
-        pdf_bytes = pdf_util.markdown_to_pdf_bytes(md or title)
-        pdf_path = f"{prefix}/report.pdf"
-        pdf_url = blob_util.upload_bytes(container, pdf_path, pdf_bytes, content_type="application/pdf")
+    # Upload md/html/pdf concurrently: each upload is an independent network
+    # round-trip, so the activity pays for the slowest one instead of the sum.
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        fut_md = ex.submit(blob_util.upload_text, container, md_path, md, content_type="text/markdown; charset=utf-8")
+        fut_html = ex.submit(blob_util.upload_text, container, html_path, html, content_type="text/html; charset=utf-8")
+        fut_pdf = None
+        if attach_pdf:
+            # Content-addressed path: PDF rendering is the most expensive
+            # step of this activity, so if a blob for this exact markdown
+            # already exists (orchestration replay, re-run of an unchanged
+            # schedule) we skip both the render and the upload.
+            digest = hashlib.blake2b((md or title).encode("utf-8"), digest_size=16).hexdigest()
+            pdf_path = f"{prefix}/report-{digest}.pdf"
+            if not blob_util.blob_exists(container, pdf_path):
+                pdf_bytes = pdf_util.markdown_to_pdf_bytes(md or title)
+                fut_pdf = ex.submit(blob_util.upload_bytes, container, pdf_path, pdf_bytes, content_type="application/pdf")
+        fut_md.result()
+        fut_html.result()
+        if fut_pdf is not None:
+            fut_pdf.result()
 
     blob_paths = {"md": md_path, "html": html_path}
     if pdf_path:
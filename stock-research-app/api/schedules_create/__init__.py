@@ -1,28 +1,28 @@
 # Create a schedule (HTTP POST /api/schedules)
 from __future__ import annotations
 
-import json
 from typing import Any, Dict, List
 
 import azure.functions as func
 import azure.durable_functions as df
 
 from ..common.auth import get_user_context
+from ..common import jsonio
 from ..common.models import Schedule, Recurrence, EmailSettings, compute_next_run_utc
 from ..common.cosmos import create_schedule as cosmos_create_schedule
 from ..common.ai_helpers import generate_title
 
 async def main(req: func.HttpRequest, starter: str) -> func.HttpResponse:
     try:
-        body: Dict[str, Any] = req.get_json()
+        body: Dict[str, Any] = jsonio.loads(req.get_body())
     except Exception:
         return func.HttpResponse(
-            json.dumps({"error": "Invalid JSON body"}),
+            jsonio.dumps({"error": "Invalid JSON body"}),
             status_code=400,
             mimetype="application/json",
         )
 
-    user = get_user_context(dict(req.headers))
+    user = get_user_context(req.headers)
     user_id = user.get("userId") or "dev-user"
 
     prompt: str = (body.get("prompt") or "").strip()
@@ -30,7 +30,7 @@ async def main(req: func.HttpRequest, starter: str) -> func.HttpResponse:
     symbols = [s.strip().upper() for s in symbols_raw if isinstance(s, str) and s.strip()]
     if not prompt and not symbols:
         return func.HttpResponse(
-            json.dumps({"error": "prompt is required (or provide symbols for backward compatibility)"}),
+            jsonio.dumps({"error": "prompt is required (or provide symbols for backward compatibility)"}),
             status_code=400,
             mimetype="application/json",
         )
@@ -40,7 +40,7 @@ async def main(req: func.HttpRequest, starter: str) -> func.HttpResponse:
         recurrence = Recurrence(**rec_in)
     except Exception as e:
         return func.HttpResponse(
-            json.dumps({"error": f"invalid recurrence: {str(e)}"}),
+            jsonio.dumps({"error": f"invalid recurrence: {str(e)}"}),
             status_code=400,
             mimetype="application/json",
         )
@@ -72,7 +72,7 @@ async def main(req: func.HttpRequest, starter: str) -> func.HttpResponse:
     saved = cosmos_create_schedule(sched)
 
     return func.HttpResponse(
-        json.dumps(saved),
+        jsonio.dumps(saved),
         status_code=201,
         mimetype="application/json",
     )
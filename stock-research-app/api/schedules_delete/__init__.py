@@ -1,15 +1,16 @@
 from __future__ import annotations
 
-import json
-from typing import Dict, Any, Iterable, Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterable, Optional, List, Tuple
 
 import azure.functions as func
 
 from ..common.auth import get_user_context
+from ..common import jsonio
 from ..common.cosmos import (
     get_schedule,
     list_reports_for_user,
-    delete_report,
+    delete_reports_bulk,
     delete_runs_for_schedule,
     delete_schedule,
 )
@@ -17,13 +18,13 @@ from ..common.config import Settings
 from ..common.blob import delete_blob
 
 async def main(req: func.HttpRequest) -> func.HttpResponse:
-    user = get_user_context(dict(req.headers))
+    user = get_user_context(req.headers)
     user_id = user.get("userId") or "dev-user"
 
     schedule_id = (req.route_params or {}).get("id")
     if not schedule_id:
         return func.HttpResponse(
-            json.dumps({"error": "schedule id is required"}),
+            jsonio.dumps({"error": "schedule id is required"}),
             status_code=400,
             mimetype="application/json",
         )
@@ -31,28 +32,34 @@ async def main(req: func.HttpRequest) -> func.HttpResponse:
     sched = get_schedule(schedule_id, user_id)
     if not sched:
         return func.HttpResponse(
-            json.dumps({"error": "schedule not found"}),
+            jsonio.dumps({"error": "schedule not found"}),
             status_code=404,
             mimetype="application/json",
         )
 
     container = Settings.REPORTS_CONTAINER or "reports"
 
-    # Delete all reports for this schedule (blobs + docs)
-    reports: List[Dict[str, Any]] = list(list_reports_for_user(user_id=user_id, schedule_id=schedule_id, limit=10000))
-    for r in reports:
-        try:
+    # Delete all reports for this schedule (blobs + docs). Iterate the lazy
+    # Cosmos pages and submit blob deletes as each report arrives, so Storage
+    # deletes overlap with fetching the remaining pages instead of waiting
+    # for the full scan; delete_blob is already best-effort.
+    report_ids: List[str] = []
+    with ThreadPoolExecutor(max_workers=32) as ex:
+        for r in list_reports_for_user(user_id=user_id, schedule_id=schedule_id, limit=10000):
+            report_ids.append(r.get("id"))
             blob_paths: Dict[str, str] = r.get("blobPaths") or {}
             for k in ("md", "html", "pdf"):
                 p = blob_paths.get(k)
                 if p:
-                    delete_blob(container, p)
-            rid = r.get("id")
-            if rid:
-                delete_report(rid, user_id)
-        except Exception:
-            # continue best-effort
-            pass
+                    ex.submit(delete_blob, container, p)
+
+    # All report docs share the userId partition, so batch the doc deletes
+    # instead of one Cosmos request per report.
+    try:
+        delete_reports_bulk(report_ids, user_id)
+    except Exception:
+        # continue best-effort
+        pass
 
     # Delete runs
     try:
@@ -64,7 +71,7 @@ async def main(req: func.HttpRequest) -> func.HttpResponse:
     deleted = delete_schedule(schedule_id, user_id)
 
     return func.HttpResponse(
-        json.dumps({"deleted": bool(deleted), "scheduleId": schedule_id}),
+        jsonio.dumps({"deleted": bool(deleted), "scheduleId": schedule_id}),
         status_code=200 if deleted else 404,
         mimetype="application/json",
     )
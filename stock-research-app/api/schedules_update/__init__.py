@@ -1,8 +1,8 @@
 # Update a schedule (HTTP PUT /api/schedules/{id})
 from __future__ import annotations
-import json
 
 from ..common.auth import get_user_context
+from ..common import jsonio
 from ..common.cosmos import update_schedule
 import azure.functions as func
 
@@ -16,13 +16,13 @@ def main(req):
 
     if found:
         return func.HttpResponse(
-            json.dumps({"message": "Schedule updated", "id": schedule_id}),
+            jsonio.dumps({"message": "Schedule updated", "id": schedule_id}),
             status_code=200,
             mimetype="application/json"
         )
     else:
         return func.HttpResponse(
-            json.dumps({"error": "Schedule not found"}),
+            jsonio.dumps({"error": "Schedule not found"}),
             status_code=404,
             mimetype="application/json"
         )
@@ -16,7 +16,13 @@ def orchestrator_function(context: df.DurableOrchestrationContext):
     }
     """
     input_data = context.get_input() or {}
-    
+
+    # No recipients means the activity would no-op anyway; returning here
+    # skips the activity dispatch and its history-table writes entirely.
+    # Deterministic branch on orchestrator input, so replay-safe.
+    if not (input_data.get("emailTo") or []):
+        return {"sent": False, "reason": "no recipients"}
+
     # Call send_email activity
     result = yield context.call_activity("send_email", input_data)
     
@@ -0,0 +1,27 @@
+# Activity: kicks off send_email_orchestrator without the parent waiting on it
+from __future__ import annotations
+
+import logging
+from typing import Dict, Any
+
+import azure.durable_functions as df
+
+logger = logging.getLogger(__name__)
+
+async def main(input: Dict[str, Any], starter: str) -> str:
+    """
+    Activity: start_email_orchestration
+    Input: the save_report output (reportId, blobPaths, emailTo, title, userId).
+    Starts send_email_orchestrator for that payload and returns its instance
+    id; the send itself runs on its own orchestration instance.
+    """
+    client = df.DurableOrchestrationClient(starter)
+    report_id = (input or {}).get("reportId") or ""
+    # Deterministic instance id so a retried activity can't double-send.
+    instance_id = await client.start_new(
+        "send_email_orchestrator",
+        f"{report_id}-email" if report_id else None,
+        input,
+    )
+    logger.info(f"start_email_orchestration: started {instance_id} for report {report_id}")
+    return instance_id
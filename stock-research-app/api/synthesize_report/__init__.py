@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 from typing import Dict, Any, List
-from ..common.openai_agent import synthesize_report as _synthesize
+from ..common.openai_agent import synthesize_report_async as _synthesize_async
 
-def main(input: Dict[str, Any]) -> Dict[str, Any]:
+async def main(input: Dict[str, Any]) -> Dict[str, Any]:
     """
     Activity: synthesize_report
     Input: {"symbols": ["AAPL","MSFT"], "sources": [{ "symbol": "AAPL", "sources": [...] }, ...], "prompt": str?}
@@ -14,4 +14,15 @@ def main(input: Dict[str, Any]) -> Dict[str, Any]:
     sources_per_symbol = input.get("sources") or []
     prompt: str = input.get("prompt") or ""
     deep_research: bool = bool(input.get("deepResearch", False))
-    return _synthesize(symbols, sources_per_symbol, prompt or None, deep_research)
+    # Multi-symbol chat synthesis fans out per symbol on the async client,
+    # so wall time is the slowest symbol instead of the sum; deep-research
+    # runs stay on the single-run pipeline (pushed to a worker thread).
+    parallel = len(symbols) > 1 and not deep_research
+    report = await _synthesize_async(
+        symbols, sources_per_symbol, prompt or None, deep_research, parallel
+    )
+    # The activity result crosses a JSON wire boundary, so force lazy
+    # fields (html) to materialize before the runtime serializes it.
+    if hasattr(report, "materialize"):
+        report = report.materialize()
+    return report
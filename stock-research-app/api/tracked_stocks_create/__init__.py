@@ -1,58 +1,50 @@
 # Create tracked stock (HTTP POST /api/tracked-stocks)
 from __future__ import annotations
 
-import json
 import azure.functions as func
 
 from ..common.auth import get_user_context
+from ..common import jsonio
 from ..common.cosmos import create_tracked_stock
 from ..common.models import TrackedStock
 
 
+def _bad_request(message: str) -> func.HttpResponse:
+    return func.HttpResponse(
+        jsonio.dumps({"error": message}),
+        status_code=400,
+        mimetype="application/json",
+    )
+
+
 async def main(req: func.HttpRequest) -> func.HttpResponse:
-    user = get_user_context(dict(req.headers))
+    user = get_user_context(req.headers)
     user_id = user.get("userId") or "dev-user"
 
     try:
         body = req.get_json()
     except Exception:
-        return func.HttpResponse(
-            json.dumps({"error": "Invalid JSON body"}),
-            status_code=400,
-            mimetype="application/json",
-        )
+        return _bad_request("Invalid JSON body")
 
     symbol = (body.get("symbol") or "").strip().upper()
     recommendation_date = (body.get("recommendationDate") or "").strip()
     recommendation_price = body.get("recommendationPrice")
 
-    if not symbol:
-        return func.HttpResponse(
-            json.dumps({"error": "symbol is required"}),
-            status_code=400,
-            mimetype="application/json",
-        )
-    if not recommendation_date:
-        return func.HttpResponse(
-            json.dumps({"error": "recommendationDate is required"}),
-            status_code=400,
-            mimetype="application/json",
-        )
-    if recommendation_price is None:
-        return func.HttpResponse(
-            json.dumps({"error": "recommendationPrice is required"}),
-            status_code=400,
-            mimetype="application/json",
-        )
+    # One table-driven pass over the required fields instead of a response
+    # constructor per branch.
+    required = (
+        ("symbol", symbol),
+        ("recommendationDate", recommendation_date),
+        ("recommendationPrice", recommendation_price),
+    )
+    missing = [name for name, value in required if value is None or value == ""]
+    if missing:
+        return _bad_request(f"{missing[0]} is required")
 
     try:
         price = float(recommendation_price)
     except (TypeError, ValueError):
-        return func.HttpResponse(
-            json.dumps({"error": "recommendationPrice must be a number"}),
-            status_code=400,
-            mimetype="application/json",
-        )
+        return _bad_request("recommendationPrice must be a number")
 
     stock = TrackedStock(
         userId=user_id,
@@ -67,7 +59,7 @@ async def main(req: func.HttpRequest) -> func.HttpResponse:
     result = create_tracked_stock(stock)
 
     return func.HttpResponse(
-        json.dumps(result),
+        jsonio.dumps(result),
         status_code=201,
         mimetype="application/json",
     )
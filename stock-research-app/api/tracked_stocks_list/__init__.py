@@ -1,15 +1,15 @@
 # List tracked stocks for current user (HTTP GET /api/tracked-stocks)
 from __future__ import annotations
 
-import json
 import azure.functions as func
 
 from ..common.auth import get_user_context
+from ..common import jsonio
 from ..common.cosmos import list_tracked_stocks_for_user
 
 
 async def main(req: func.HttpRequest) -> func.HttpResponse:
-    user = get_user_context(dict(req.headers))
+    user = get_user_context(req.headers)
     user_id = user.get("userId") or "dev-user"
 
     limit_raw = req.params.get("limit")
@@ -21,7 +21,7 @@ async def main(req: func.HttpRequest) -> func.HttpResponse:
     items = list_tracked_stocks_for_user(user_id=user_id, limit=limit)
 
     return func.HttpResponse(
-        json.dumps(items),
+        jsonio.dumps(items),
         status_code=200,
         mimetype="application/json",
     )
@@ -1,11 +1,16 @@
 # Fetch current prices for symbols (HTTP GET /api/tracked-stocks/prices?symbols=AAPL,MSFT&exchanges=,)
 from __future__ import annotations
 
-import json
 import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
 import azure.functions as func
 
 from ..common.auth import get_user_context
+from ..common import jsonio
 
 logger = logging.getLogger(__name__)
 
@@ -15,35 +20,102 @@ _EXCHANGE_SUFFIX = {
     "BSE": ".BO",
 }
 
+# Short-TTL price cache keyed per (symbol, exchange): scheduler ticks and UI
+# refreshes often re-request overlapping symbol sets within seconds, and
+# per-symbol entries let a request with one new ticker fetch just that one
+# instead of missing the whole set. Bounded LRU — the keys come straight
+# from request query strings, so an unbounded dict would grow without limit.
+_PRICE_CACHE: OrderedDict = OrderedDict()
+_PRICE_CACHE_MAX = 512
+_PRICE_CACHE_TTL = 30.0
+_price_lock = threading.Lock()
+
+
+def _clear_price_cache() -> None:
+    with _price_lock:
+        _PRICE_CACHE.clear()
+
+
+# Shared HTTP session for yfinance: keeps TCP+TLS and Yahoo cookies warm
+# across invocations. The Tickers object itself must be rebuilt per call —
+# yfinance caches fast_info (and its last_price) on each Ticker, so a reused
+# object would serve the first price it ever fetched forever.
+_yf_session = None
+_yf_session_lock = threading.Lock()
+
+
+def _get_yf_session():
+    global _yf_session
+    if _yf_session is None:
+        with _yf_session_lock:
+            if _yf_session is None:
+                import requests
+                _yf_session = requests.Session()
+    return _yf_session
+
 
 def _fetch_prices(symbols: list[str], exchanges: list[str]) -> dict[str, float | None]:
     """Fetch current market prices via yfinance, applying exchange suffixes."""
+    now = time.monotonic()
+    result: dict[str, float | None] = {}
+    missing: list[tuple[str, str]] = []
+    with _price_lock:
+        for sym, exch in zip(symbols, exchanges):
+            hit = _PRICE_CACHE.get((sym, exch))
+            if hit is not None and now - hit[0] < _PRICE_CACHE_TTL:
+                _PRICE_CACHE.move_to_end((sym, exch))
+                result[sym] = hit[1]
+            else:
+                missing.append((sym, exch))
+    if not missing:
+        return result
     try:
-        import yfinance as yf
         # Build yfinance tickers with exchange suffixes
-        yf_map: dict[str, str] = {}  # yf_ticker -> original_symbol
-        for sym, exch in zip(symbols, exchanges):
+        yf_map: dict[str, tuple[str, str]] = {}  # yf_ticker -> (symbol, exchange)
+        for sym, exch in missing:
             suffix = _EXCHANGE_SUFFIX.get(exch.upper(), "") if exch else ""
             yf_ticker = f"{sym}{suffix}"
-            yf_map[yf_ticker] = sym
+            yf_map[yf_ticker] = (sym, exch)
 
-        result: dict[str, float | None] = {}
-        tickers = yf.Tickers(" ".join(yf_map.keys()))
-        for yf_ticker, orig_sym in yf_map.items():
+        if not yf_map:
+            return result
+        import yfinance as yf
+        tickers = yf.Tickers(" ".join(yf_map.keys()), session=_get_yf_session())
+
+        def _one(item: tuple[str, tuple[str, str]]) -> tuple[str, str, float | None]:
+            yf_ticker, (orig_sym, exch) = item
             try:
                 info = tickers.tickers[yf_ticker].fast_info
                 price = getattr(info, "last_price", None)
-                result[orig_sym] = round(price, 2) if price else None
+                return orig_sym, exch, round(price, 2) if price else None
             except Exception:
-                result[orig_sym] = None
+                return orig_sym, exch, None
+
+        # fast_info does a blocking HTTP call per ticker; fan out so wall
+        # time is the slowest quote instead of the sum of all of them.
+        with ThreadPoolExecutor(max_workers=min(16, len(yf_map))) as ex:
+            fetched = list(ex.map(_one, yf_map.items()))
+        now = time.monotonic()
+        with _price_lock:
+            for sym, exch, price in fetched:
+                # Only cache real quotes: _one returns None on any per-ticker
+                # error, and caching that would pin "no price" for the TTL
+                # instead of retrying on the next request.
+                if price is None:
+                    continue
+                _PRICE_CACHE[(sym, exch)] = (now, price)
+                if len(_PRICE_CACHE) > _PRICE_CACHE_MAX:
+                    _PRICE_CACHE.popitem(last=False)
+        result.update({sym: price for sym, _exch, price in fetched})
         return result
     except Exception as exc:
         logger.warning("yfinance fetch failed: %s", exc)
-        return {s: None for s in symbols}
+        result.update({s: None for s, _e in missing})
+        return result
 
 
 async def main(req: func.HttpRequest) -> func.HttpResponse:
-    get_user_context(dict(req.headers))  # auth check
+    get_user_context(req.headers)  # auth check
 
     raw = req.params.get("symbols", "")
     symbols = [s.strip().upper() for s in raw.split(",") if s.strip()]
@@ -55,7 +127,7 @@ async def main(req: func.HttpRequest) -> func.HttpResponse:
 
     if not symbols:
         return func.HttpResponse(
-            json.dumps({"error": "symbols query parameter required (comma-separated)"}),
+            jsonio.dumps({"error": "symbols query parameter required (comma-separated)"}),
             status_code=400,
             mimetype="application/json",
         )
@@ -65,7 +137,7 @@ async def main(req: func.HttpRequest) -> func.HttpResponse:
     prices = _fetch_prices(symbols, exchanges_list)
 
     return func.HttpResponse(
-        json.dumps({"prices": prices}),
+        jsonio.dumps({"prices": prices}),
         status_code=200,
         mimetype="application/json",
     )